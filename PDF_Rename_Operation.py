@@ -6,6 +6,7 @@ PDF重命名工具主程序
 import os
 import sys
 import logging
+import multiprocessing
 from datetime import datetime
 from typing import List, Dict, Optional
 import pandas as pd
@@ -17,7 +18,7 @@ import subprocess
 import webbrowser
 
 # 导入自定义模块
-from pdf_processor import PDFProcessor
+from pdf_processor import PDFProcessor, process_pdf_batch
 from auto_updater.config import get_config
 
 def get_version_display_text():
@@ -221,15 +222,25 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             self.textBrowser.append("部分文件重命名失败，请检查错误信息。")
 
     def process_files_directly(self):
-        """直接处理PDF文件，不使用多线程"""
+        """处理PDF文件：先多进程并行提取所有PDF信息，再逐个重命名"""
         results = []
 
         try:
+            # 命名规则在整个批次内不变，只读取并解析一次
+            new_naming_rule = self._get_gui_config().get('new_naming_rule', self.processor.new_naming_rule)
+            rename_func = self.processor.prepare_rename(new_naming_rule, ".pdf")
+
+            # 文本提取是主要耗时且各文件互不依赖，交给进程池并行处理
+            self.textBrowser.append(f"正在提取 {len(self.pdf_files)} 个文件的PDF信息...")
+            QApplication.processEvents()
+            infos = process_pdf_batch(self.pdf_files, self.processor.get_batch_config(),
+                                      progress_callback=self._on_extract_progress)
+
             for i, pdf_path in enumerate(self.pdf_files):
                 self.textBrowser.append(f"正在处理第 {i+1}/{len(self.pdf_files)} 个文件: {os.path.basename(pdf_path)}")
 
                 # 处理单个文件
-                result = self.process_single_file(pdf_path)
+                result = self.process_single_file(pdf_path, new_naming_rule, rename_func, infos[i])
                 results.append(result)
 
                 # 显示处理结果
@@ -259,11 +270,26 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
         return results
 
-    def process_single_file(self, pdf_path):
-        """处理单个PDF文件"""
+    def _on_extract_progress(self, done, total):
+        """批量提取进度回调：定期刷新界面，避免长批次时窗口无响应"""
+        if done == total or done % 20 == 0:
+            self.statusBar().showMessage(f"正在提取PDF信息: {done}/{total}")
+        QApplication.processEvents()
+
+    def process_single_file(self, pdf_path, new_naming_rule=None, rename_func=None, info=None):
+        """
+        处理单个PDF文件
+
+        Args:
+            pdf_path: PDF文件路径
+            new_naming_rule: 批量处理时预先读取的命名规则，为None时从GUI读取
+            rename_func: prepare_rename返回的重命名函数，为None时调用rearrange_fields_by_rule
+            info: process_pdf_batch预先提取的PDF信息，为None时在此提取
+        """
         try:
             # 提取PDF信息（使用新的格式）
-            info = self.processor.extract_pdf_info(pdf_path)
+            if info is None:
+                info = self.processor.extract_pdf_info(pdf_path)
 
             if info['error']:
                 logger.error(f"提取PDF信息失败: {info['error']}")
@@ -313,7 +339,8 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             # 使用新的规则重排功能生成文件名
             try:
                 # 获取GUI配置的新命名规则
-                new_naming_rule = self._get_gui_config().get('new_naming_rule', self.processor.new_naming_rule)
+                if new_naming_rule is None:
+                    new_naming_rule = self._get_gui_config().get('new_naming_rule', self.processor.new_naming_rule)
 
                 # 调试：详细记录传递给rearrange_fields_by_rule的参数
                 logger.info(f"=== 调试：文件名生成开始 ===")
@@ -333,11 +360,14 @@ class MainWindow(QMainWindow, Ui_MainWindow):
                         if similar_keys:
                             logger.warning(f"  找到相似字段名: {similar_keys}")
 
-                new_filename = self.processor.rearrange_fields_by_rule(
-                    new_naming_rule,
-                    field_values,
-                    ".pdf"  # 明确指定扩展名
-                )
+                if rename_func is not None:
+                    new_filename = rename_func(field_values)
+                else:
+                    new_filename = self.processor.rearrange_fields_by_rule(
+                        new_naming_rule,
+                        field_values,
+                        ".pdf"  # 明确指定扩展名
+                    )
                 logger.info(f"使用命名规则生成文件名: {new_naming_rule} -> {new_filename}")
                 logger.info(f"=== 调试：文件名生成结束 ===")
             except Exception as e:
@@ -1445,4 +1475,6 @@ def main():
     sys.exit(app.exec_())
 
 if __name__ == "__main__":
+    # 打包后的exe中，多进程工作进程会重新运行本入口，需先交给freeze_support处理
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
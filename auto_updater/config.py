@@ -8,6 +8,8 @@
 
 import os
 import sys
+import json
+import tempfile
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Optional
@@ -25,6 +27,35 @@ from .config_constants import (
 # 配置文件名（保持兼容性）
 UPDATE_STATE_FILE = "update_state.json"
 DEFAULT_UPDATE_CONFIG_FILE = "update_config.json"  # 默认更新配置文件名
+UPDATER_CONFIG_FILE = "updater_config.json"  # 主配置文件名
+
+# 配置和状态文件所在目录（打包后为exe所在目录，否则为项目根目录），运行期间不变，导入时计算一次
+if getattr(sys, 'frozen', False):
+    _APP_DIR = os.path.dirname(sys.executable)
+else:
+    _APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _atomic_write_json(path: str, data: dict):
+    """
+    原子写入JSON文件：先写入同目录临时文件并fsync，再用os.replace替换目标文件，
+    写入中途崩溃或断电时不会留下被截断的配置文件
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".",
+                                    prefix=os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
 
 class Config:
     """配置管理类 - 使用内置配置常量"""
@@ -32,6 +63,9 @@ class Config:
     def __init__(self):
         self._config = DEFAULT_CONFIG.copy()  # 直接使用预定义的配置
         self._version_cache = {}  # 版本解析缓存
+        self._state_cache = None  # 状态文件内容缓存
+        self._state_mtime = None  # 缓存对应的状态文件修改时间
+        self._saved_config_text = None  # 最近一次写入配置文件的内容
 
     @property
     def github_repo(self) -> str:
@@ -108,6 +142,10 @@ class Config:
         :return: 是否更新成功
         """
         try:
+            # 版本号未变化时无需清除缓存和重写配置文件
+            if new_version == self.current_version:
+                return True
+
             self._config["version"]["current"] = new_version
             # 清除版本缓存以确保一致性
             self._version_cache.clear()
@@ -123,14 +161,15 @@ class Config:
         :return: 是否保存成功
         """
         try:
-            if getattr(sys, 'frozen', False):
-                exec_dir = os.path.dirname(sys.executable)
-            else:
-                exec_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            config_path = os.path.join(_APP_DIR, UPDATER_CONFIG_FILE)
 
-            config_path = os.path.join(exec_dir, UPDATER_CONFIG_FILE)
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(self._config, f, indent=2, ensure_ascii=False)
+            # 内容与上次写入一致且文件仍存在时无需重写
+            config_text = json.dumps(self._config, sort_keys=True, ensure_ascii=False)
+            if config_text == self._saved_config_text and os.path.exists(config_path):
+                return True
+
+            _atomic_write_json(config_path, self._config)
+            self._saved_config_text = config_text
             return True
         except Exception as e:
             print(f"保存配置文件失败: {e}")
@@ -226,17 +265,17 @@ class Config:
     def _load_state(self) -> dict:
         """加载状态文件"""
         try:
-            if getattr(sys, 'frozen', False):
-                exec_dir = os.path.dirname(sys.executable)
-            else:
-                exec_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-
-            state_path = os.path.join(exec_dir, UPDATE_STATE_FILE)
-            if os.path.exists(state_path):
-                with open(state_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            else:
+            state_path = os.path.join(_APP_DIR, UPDATE_STATE_FILE)
+            try:
+                mtime = os.stat(state_path).st_mtime_ns
+            except FileNotFoundError:
                 return {}
+
+            # 文件未修改时直接使用缓存，返回副本避免调用方修改缓存内容
+            if self._state_cache is None or self._state_mtime != mtime:
+                self._state_cache = json.loads(Path(state_path).read_bytes())
+                self._state_mtime = mtime
+            return dict(self._state_cache)
         except Exception as e:
             print(f"加载状态文件失败: {e}")
             return {}
@@ -244,14 +283,21 @@ class Config:
     def _save_state(self, state: dict) -> bool:
         """保存状态文件"""
         try:
-            if getattr(sys, 'frozen', False):
-                exec_dir = os.path.dirname(sys.executable)
-            else:
-                exec_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            state_path = os.path.join(_APP_DIR, UPDATE_STATE_FILE)
+
+            # 与磁盘上（未被外部修改）的状态一致时跳过写入
+            if self._state_cache is not None and state == self._state_cache:
+                try:
+                    if os.stat(state_path).st_mtime_ns == self._state_mtime:
+                        return True
+                except FileNotFoundError:
+                    pass
+
+            _atomic_write_json(state_path, state)
 
-            state_path = os.path.join(exec_dir, UPDATE_STATE_FILE)
-            with open(state_path, 'w', encoding='utf-8') as f:
-                json.dump(state, f, indent=2, ensure_ascii=False)
+            # 写入后直接更新缓存，下次读取无需重新解析刚写入的文件
+            self._state_cache = dict(state)
+            self._state_mtime = os.stat(state_path).st_mtime_ns
             return True
         except Exception as e:
             print(f"保存状态文件失败: {e}")
@@ -3,6 +3,7 @@
 自动更新器配置常量
 将JSON配置信息转换为Python常量，消除外部文件依赖
 """
+import re
 
 # 应用配置
 APP_NAME: str = "PDF重命名工具"
@@ -62,9 +63,16 @@ DEFAULT_CONFIG: dict = {
     }
 }
 
+# 常见的纯数字点分版本号（如 4.0.2），无需交给packaging解析
+_SIMPLE_VERSION_RE = re.compile(r'[0-9]+(?:\.[0-9]+)*')
+
 # 版本信息验证
 def validate_version_format(version_str: str) -> bool:
     """验证版本号格式是否有效"""
+    if isinstance(version_str, str) and _SIMPLE_VERSION_RE.fullmatch(version_str):
+        return True
+
+    # 预发布等其他格式仍按packaging的规则判断
     try:
         from packaging import version as pkg_version
         pkg_version.parse(version_str)
@@ -54,8 +54,9 @@ class SettingsManager:
         """加载配置"""
         try:
             if os.path.exists(self.config_file):
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    config_data = json.load(f)
+                # 小文件一次读取为bytes后解析，跳过文本包装层
+                with open(self.config_file, 'rb') as f:
+                    config_data = json.loads(f.read())
 
                 # 更新设置
                 for key, value in config_data.items():
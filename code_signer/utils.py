@@ -115,6 +115,12 @@ def safe_subprocess_run(cmd, encoding='utf-8', fallback_encodings=None, **kwargs
         return FailedResult(str(e))
 
 
+def sdk_version_key(signtool_path: str) -> Tuple[int, ...]:
+    """从 ...\\bin\\<版本>\\x64\\signtool.exe 中取出Windows SDK版本号，用于选取最新版本"""
+    version_dir = os.path.basename(os.path.dirname(os.path.dirname(signtool_path)))
+    return tuple(int(part) for part in version_dir.split('.') if part.isdigit())
+
+
 def find_signtool(path_config: str = "auto") -> Optional[str]:
     """
     查找signtool.exe
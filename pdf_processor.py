@@ -2,22 +2,111 @@
 """
 PDF处理器模块
 负责PDF文本提取、信息分析和重命名处理
-重新设计为简洁的单线程处理模式
+重新设计为简洁的单线程处理模式，批量场景可使用process_pdf_batch多进程并行提取
 """
 import os
 import re
 import sys
 import logging
+import functools
+import multiprocessing
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Any, Callable
 import PyPDF2
 
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+# PDFium(C++)文本提取后端，已列入打包依赖；仅在源码运行环境未安装时回退到PyPDF2
+try:
+    import pypdfium2 as pdfium
+    PDFIUM_AVAILABLE = True
+except ImportError:
+    PDFIUM_AVAILABLE = False
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Report No 字段的名称变体（小写），共用预编译的Report No模式
+_REPORT_NO_ALIASES = frozenset({"report no", "report number", "report no."})
+
+# Sampling ID 提取模式（同一次search完成定位和取值）
+_SAMPLING_ID_PATTERN = re.compile(r'Sampling\s*ID\s*:\s*(.+)', re.IGNORECASE)
+
+# 字段名映射表 - 处理常见的字段名变体（别名 -> 标准字段名）
+_RAW_FIELD_MAPPING = {
+    # 报告编号变体
+    'Test Report No': 'Report No',
+    'Report No': 'Report No',
+    'Report Number': 'Report No',
+    '报告编号': 'Report No',
+
+    # SKU ID变体
+    'SKU ID': 'Sampling ID',
+    'SKU': 'Sampling ID',
+    'Sku': 'Sampling ID',
+    'sku': 'Sampling ID',
+    'SKU No': 'Sampling ID',
+
+    # Goods ID变体
+    'Goods ID': 'Report No',
+    'Goods No': 'Report No',
+    'Product ID': 'Report No',
+    'Product No': 'Report No',
+
+    # 结论变体
+    'Overall Conclusion': '结论',
+    'Conclusion': '结论',
+    'Final Conclusion': '结论',
+    '最终结论': '结论',
+    'Test Result': '结论',
+    'Result': '结论',
+}
+
+# 字段名均驻留（intern），dict查找时可直接按指针比较
+_FIELD_MAPPING = {sys.intern(alias): sys.intern(canonical) for alias, canonical in _RAW_FIELD_MAPPING.items()}
+
+# 小写别名 -> 小写标准字段名（同一别名的大小写变体均映射到同一字段），
+# 标准字段名自身也作为别名收录，查找时一次dict访问即可得到标准字段名
+_ALIAS_TO_CANONICAL = {sys.intern(canonical.lower()): sys.intern(canonical.lower())
+                       for canonical in _FIELD_MAPPING.values()}
+_ALIAS_TO_CANONICAL.update({sys.intern(alias.lower()): sys.intern(canonical.lower())
+                            for alias, canonical in _FIELD_MAPPING.items()})
+
+# 文件名备用解析：由数字、点、横线组成且至少包含一个数字
+_DOTTED_NUM_RE = re.compile(r'[\d.\-]*\d[\d.\-]*')
+
+# 文件名备用解析中可识别的结论值
+_CONCLUSION_SET = frozenset({'Pass', 'Fail', 'pass', 'fail', '符合', '不符合', '合格', '不合格'})
+
+# 文件名清理：Windows非法字符（含路径分隔符和控制字符）、连续下划线、连续空白
+# 制表符、换行等空白控制字符(\x09-\x0d)不在此列，由空白合并统一替换为空格
+_ILLEGAL_FILENAME_RE = re.compile(r'[<>:"/\\|?*\x00-\x08\x0e-\x1f]')
+_MULTI_UNDERSCORE_RE = re.compile(r'_{2,}')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# 结论关键词（Fail优先级高于Pass）
+_PASS_KEYWORDS = ('pass', 'compliant', '符合', '合格', '通过', 'ok', 'yes')
+_FAIL_KEYWORDS = ('fail', 'non-compliant', '不符合', '不合格', '不通过', 'failed', 'no', 'ng')
+
+# ASCII大写->小写的字节转换表，关键词均为ASCII或中文，无需完整的Unicode小写转换
+_LOWER_TRANS = bytes.maketrans(bytes(range(65, 91)), bytes(range(97, 123)))
+
+
+def _encode_lower(text: str) -> bytes:
+    """将文本编码为UTF-8并将ASCII字母转为小写"""
+    return text.encode('utf-8', 'ignore').translate(_LOWER_TRANS)
+
 class PDFProcessor:
     """PDF处理类，负责提取PDF信息和重命名"""
 
+    # 固定属性集合：减少实例内存并加快热循环中的属性访问
+    __slots__ = (
+        'test_methods', 'info_fields', 'enable_test_analysis',
+        'original_naming_rule', 'new_naming_rule', 'info_field_list', 'enable_fuzzy_field_match',
+        '_report_no_patterns', '_field_pattern_cache', '_test_method_patterns',
+        '_field_config_cache', '_combined_field_re',
+        '_combined_field_key', '_valid_config_pattern', '_pass_keys_b', '_fail_keys_b',
+        '_placeholder_cache',
+    )
+
     def __init__(self, info_fields=None, enable_test_analysis=True):
         """
         初始化PDF处理器
@@ -29,6 +118,8 @@ class PDFProcessor:
         self.test_methods = []
         self.info_fields = info_fields or "Sampling ID;Report No"  # 默认字段
         self.enable_test_analysis = enable_test_analysis
+        # 精确/别名查找失败时是否继续尝试字段名包含匹配
+        self.enable_fuzzy_field_match = True
 
         # 新增命名规则相关属性
         self.original_naming_rule = "Sampling ID-Report No-结论"
@@ -40,10 +131,20 @@ class PDFProcessor:
             re.compile(r'Report\s*Number\s*:\s*(.+)', re.IGNORECASE)
         ]
         self._field_pattern_cache = {}  # 缓存字段模式
-        self._valid_config_pattern = re.compile(r'^[a-zA-Z0-9\s\u4e00-\u9fa5:;_\-\.]+$')
+        self._test_method_patterns = {}  # 缓存测试方法模式
+        self._field_config_cache = {}  # 缓存字段配置解析结果
+        self._placeholder_cache = {}  # 缓存字段名对应的UNKNOWN_占位符
+        self._combined_field_re = None  # 所有信息字段模式合并后的预筛选正则
+        self._combined_field_key = None  # 构建合并正则时的字段列表
+        self._valid_config_pattern = re.compile(r'[a-zA-Z0-9\s\u4e00-\u9fa5:;_\-\.]+')
+
+        # 预编码结论关键词，行内检索使用bytes.find
+        self._pass_keys_b = tuple(k.encode('utf-8') for k in _PASS_KEYWORDS)
+        self._fail_keys_b = tuple(k.encode('utf-8') for k in _FAIL_KEYWORDS)
 
         # 解析信息字段列表
         self.info_field_list = self.parse_field_config(self.info_fields)
+        self._build_combined_field_pattern()
         logger.info(f"PDFProcessor初始化完成，信息字段: {self.info_field_list}, 测试分析: {enable_test_analysis}")
 
     def sanitize_filename(self, filename: str) -> str:
@@ -56,20 +157,17 @@ class PDFProcessor:
         Returns:
             str: 清理后的合法文件名
         """
-        # Windows文件名非法字符: < > : " | ? * \
-        illegal_chars = r'[<>:"|?*\\]'
-
-        # 将非法字符替换为下划线
-        sanitized = re.sub(illegal_chars, '_', filename)
+        # 将Windows文件名非法字符（< > : " / \ | ? * 及控制字符）替换为下划线
+        sanitized = _ILLEGAL_FILENAME_RE.sub('_', filename)
 
         # 只移除多余的连续下划线，保留连字符（用于字段分隔）
-        sanitized = re.sub(r'_{2,}', '_', sanitized)
-        sanitized = re.sub(r'\s+', ' ', sanitized)
+        sanitized = _MULTI_UNDERSCORE_RE.sub('_', sanitized)
+        sanitized = _WHITESPACE_RE.sub(' ', sanitized)
 
         # 移除开头和结尾的空格、点、下划线
         sanitized = sanitized.strip(' ._-')
 
-        logger.debug(f"文件名清理: '{filename}' -> '{sanitized}'")
+        logger.debug("文件名清理: '%s' -> '%s'", filename, sanitized)
         return sanitized
 
     def parse_filename_backup(self, filename: str) -> Dict[str, str]:
@@ -101,15 +199,15 @@ class PDFProcessor:
                 potential_sampling_id = parts[2].strip()
 
                 # 验证字段格式
-                if '.' in potential_report_no and potential_report_no.replace('.', '').replace('-', '').isdigit():
+                if '.' in potential_report_no and _DOTTED_NUM_RE.fullmatch(potential_report_no):
                     field_values['Report No'] = potential_report_no
                     logger.debug(f"从文件名解析出Report No: {potential_report_no}")
 
-                if potential_sampling_id.isdigit() or (potential_sampling_id.replace('.', '').replace('-', '').isdigit() and len(potential_sampling_id) > 6):
+                if potential_sampling_id.isdigit() or (len(potential_sampling_id) > 6 and _DOTTED_NUM_RE.fullmatch(potential_sampling_id)):
                     field_values['Sampling ID'] = potential_sampling_id
                     logger.debug(f"从文件名解析出Sampling ID: {potential_sampling_id}")
 
-                if potential_conclusion in ['Pass', 'Fail', 'pass', 'fail', '符合', '不符合', '合格', '不合格']:
+                if potential_conclusion in _CONCLUSION_SET:
                     field_values['结论'] = potential_conclusion
                     logger.debug(f"从文件名解析出结论: {potential_conclusion}")
 
@@ -121,14 +219,63 @@ class PDFProcessor:
     def set_test_methods(self, methods_str: str):
         """设置测试方法列表"""
         self.test_methods = [method.strip() for method in methods_str.split(';') if method.strip()]
+        # 预编译测试方法的匹配模式，避免每次查找时重新构建
+        self._test_method_patterns = {
+            method: re.compile(re.escape(method), re.IGNORECASE) for method in self.test_methods
+        }
         logger.info(f"设置测试方法: {self.test_methods}")
 
     def set_info_fields(self, info_fields_str: str):
         """设置信息字段列表"""
         self.info_fields = info_fields_str or "Sampling ID;Report No"
         self.info_field_list = self.parse_field_config(self.info_fields)
+        self._build_combined_field_pattern()
         logger.info(f"设置信息字段: {self.info_field_list}")
 
+    def _build_combined_field_pattern(self):
+        """
+        将所有信息字段的模式合并为一个正则（字段配置在批次内固定）
+
+        合并正则只用于筛选可能包含字段的行：某行不匹配合并正则时，
+        任何单个字段模式都不会匹配该行
+        """
+        field_key = tuple(self.info_field_list)
+        patterns = []
+        for field_name in field_key:
+            for pattern in self._get_field_patterns(field_name):
+                if pattern.pattern not in patterns:
+                    patterns.append(pattern.pattern)
+
+        self._combined_field_re = re.compile(
+            '|'.join(f'(?:{pattern})' for pattern in patterns), re.IGNORECASE
+        ) if patterns else None
+        self._combined_field_key = field_key
+
+    def _filter_field_lines(self, text: str) -> List[tuple]:
+        """
+        单次遍历文本，返回可能包含信息字段的行
+
+        Args:
+            text (str): PDF文本内容
+
+        Returns:
+            List[tuple]: (行号, 去除首尾空白的行) 列表
+        """
+        # 字段列表被直接修改时重新构建合并正则
+        if self._combined_field_key != tuple(self.info_field_list):
+            self._build_combined_field_pattern()
+
+        combined = self._combined_field_re
+        if combined is None:
+            return []
+
+        candidate_lines = []
+        for line_num, line in enumerate(text.split('\n')):
+            line = line.strip()
+            if line and combined.search(line):
+                candidate_lines.append((line_num, line))
+        return candidate_lines
+
     def parse_field_config(self, config_str: str) -> List[str]:
         """
         解析字段配置字符串，支持带冒号和不带冒号的格式
@@ -142,19 +289,23 @@ class PDFProcessor:
         if not config_str:
             return ["Sampling ID", "Report No"]
 
+        # 相同配置字符串直接复用解析结果
+        cached_fields = self._field_config_cache.get(config_str)
+        if cached_fields is not None:
+            return list(cached_fields)
+
+        # 只分割一次，验证和解析共用分割结果
+        raw_fields = [field for field in map(str.strip, config_str.split(';')) if field]
+
         # 验证配置格式
-        validation_result = self.validate_field_config(config_str)
+        validation_result = self.validate_field_config(config_str, raw_fields)
         if not validation_result['is_valid']:
             logger.warning(f"字段配置格式有误: {validation_result['error']}")
             # 使用默认配置
             return ["Sampling ID", "Report No"]
 
         fields = []
-        for field in config_str.split(';'):
-            field = field.strip()
-            if not field:
-                continue
-
+        for field in raw_fields:
             # 移除末尾的冒号，统一标准化字段名
             if field.endswith(':'):
                 field = field[:-1].strip()
@@ -163,14 +314,17 @@ class PDFProcessor:
                 fields.append(field)
 
         logger.debug(f"解析字段配置: '{config_str}' -> {fields}")
-        return fields if fields else ["Sampling ID", "Report No"]
+        fields = fields if fields else ["Sampling ID", "Report No"]
+        self._field_config_cache[config_str] = tuple(fields)
+        return fields
 
-    def validate_field_config(self, config_str: str) -> Dict[str, any]:
+    def validate_field_config(self, config_str: str, raw_fields: List[str] = None) -> Dict[str, any]:
         """
         验证字段配置字符串的格式（优化版本）
 
         Args:
             config_str (str): 配置字符串
+            raw_fields (List[str], optional): 已按分号分割并去除空白的非空字段，避免重复分割
 
         Returns:
             Dict[str, any]: 验证结果，包含is_valid和error信息
@@ -179,22 +333,21 @@ class PDFProcessor:
             return {'is_valid': True, 'error': None}
 
         # 使用预编译的正则表达式进行字符验证
-        if not self._valid_config_pattern.match(config_str):
+        if not self._valid_config_pattern.fullmatch(config_str):
             return {
                 'is_valid': False,
                 'error': "配置字符串包含无效字符，只允许字母、数字、中文、空格、冒号、分号、下划线、横线和点号"
             }
 
-        # 合并字符和长度验证，提高效率
-        fields = [f.strip().rstrip(':') for f in config_str.split(';') if f.strip()]
-
-        # 批量验证字段长度
-        invalid_fields = [f for f in fields if len(f) > 50 or len(f) < 2]
-        if invalid_fields:
-            field_info = ', '.join([f"'{f}'(长度:{len(f)})" for f in invalid_fields[:2]])  # 只显示前两个错误字段
+        # 惰性验证字段长度，遇到第一个不合格字段即返回
+        if raw_fields is None:
+            raw_fields = [f for f in map(str.strip, config_str.split(';')) if f]
+        fields = (f.rstrip(':') for f in raw_fields)
+        invalid_field = next((f for f in fields if not 2 <= len(f) <= 50), None)
+        if invalid_field is not None:
             return {
                 'is_valid': False,
-                'error': f"字段长度不符合要求(2-50字符): {field_info}..."
+                'error': f"字段长度不符合要求(2-50字符): '{invalid_field}'(长度:{len(invalid_field)})"
             }
 
         return {'is_valid': True, 'error': None}
@@ -256,6 +409,20 @@ class PDFProcessor:
 
         return result
 
+    def get_batch_config(self) -> Dict[str, Any]:
+        """
+        导出当前的提取配置，供process_pdf_batch在工作进程中重建相同的处理器
+
+        Returns:
+            Dict[str, Any]: 包含info_fields、enable_test_analysis、test_methods、enable_fuzzy_field_match
+        """
+        return {
+            'info_fields': self.info_fields,
+            'enable_test_analysis': self.enable_test_analysis,
+            'test_methods': ';'.join(self.test_methods),
+            'enable_fuzzy_field_match': self.enable_fuzzy_field_match,
+        }
+
     def _get_config_suggestion(self, error_msg: str) -> str:
         """
         根据错误信息提供配置建议
@@ -313,6 +480,9 @@ class PDFProcessor:
             logger.info(f"开始混合信息提取，PDF文本长度: {len(pdf_text) if pdf_text else 0}")
             logger.info(f"文件名解析结果: {filename_info}")
 
+            # 单次遍历文本，筛选出可能包含任一字段的行
+            field_lines = self._filter_field_lines(pdf_text) if pdf_text else []
+
             # 对每个配置的字段进行提取
             for field_name in self.info_field_list:
                 pdf_value = None
@@ -325,7 +495,7 @@ class PDFProcessor:
                         pass  # 稍后处理
                     else:
                         # 使用动态字段提取方法
-                        pdf_value = self._extract_field_by_keyword(pdf_text, field_name)
+                        pdf_value = self._extract_field_by_keyword(pdf_text, field_name, field_lines)
 
                 # 如果PDF提取失败，尝试从文件名解析
                 if pdf_value:
@@ -382,7 +552,48 @@ class PDFProcessor:
             }
 
     def _extract_pdf_text(self, pdf_path: str) -> str:
-        """提取PDF所有页面的文本内容"""
+        """提取PDF所有页面的文本内容，优先使用PDFium后端"""
+        if PDFIUM_AVAILABLE:
+            try:
+                return self._extract_pdf_text_pdfium(pdf_path)
+            except Exception as e:
+                logger.warning(f"PDFium提取文本失败，回退到PyPDF2: {e}")
+
+        return self._extract_pdf_text_pypdf2(pdf_path)
+
+    def _extract_pdf_text_pdfium(self, pdf_path: str) -> str:
+        """使用pypdfium2提取PDF所有页面的文本内容"""
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            page_texts = []
+            page_count = len(pdf)
+            logger.info(f"PDF总页数: {page_count}")
+
+            for i in range(page_count):
+                page = pdf[i]
+                try:
+                    textpage = page.get_textpage()
+                    try:
+                        page_text = textpage.get_text_range()
+                    finally:
+                        textpage.close()
+                finally:
+                    page.close()
+
+                if page_text:
+                    # PDFium使用\r\n换行，统一为\n以便按行解析
+                    page_texts.append(page_text.replace('\r\n', '\n').replace('\r', '\n'))
+                else:
+                    logger.warning(f"第 {i+1} 页文本为空")
+        finally:
+            pdf.close()
+
+        text = " ".join(page_texts).strip()
+        logger.info(f"PDF文本提取完成(PDFium)，总文本长度: {len(text)} 字符")
+        return text
+
+    def _extract_pdf_text_pypdf2(self, pdf_path: str) -> str:
+        """使用PyPDF2提取PDF所有页面的文本内容"""
         try:
             with open(pdf_path, 'rb') as file:
                 pdf_reader = PyPDF2.PdfReader(file)
@@ -458,29 +669,27 @@ class PDFProcessor:
     def _extract_sampling_id(self, text: str) -> Optional[str]:
         """提取Sampling ID - 从同一行中提取关键词后的值"""
         lines = text.split('\n')
-        logger.debug(f"开始提取Sampling ID，总行数: {len(lines)}")
-        logger.debug(f"前10行内容: {lines[:10]}")
+        logger.debug("开始提取Sampling ID，总行数: %d", len(lines))
+        logger.debug("前10行内容: %s", lines[:10])
 
         for line_num, line in enumerate(lines):
             line = line.strip()
             if not line:
                 continue
 
-            # 查找包含 "Sampling ID:" 的行
-            if re.search(r'Sampling\s*ID\s*:', line, re.IGNORECASE):
-                logger.debug(f"找到Sampling ID行 {line_num}: '{line}'")
+            # 查找包含 "Sampling ID:" 的行，并提取冒号后面的所有内容
+            match = _SAMPLING_ID_PATTERN.search(line)
+            if match:
+                logger.debug("找到Sampling ID行 %d: '%s'", line_num, line)
 
-                # 提取冒号后面的所有内容
-                match = re.search(r'Sampling\s*ID\s*:\s*(.+)', line, re.IGNORECASE)
-                if match:
-                    sampling_id = match.group(1).strip()
-                    # 清理掉多余的空格和特殊字符，但保留点、横线、下划线
-                    sampling_id = re.sub(r'\s+', '', sampling_id)  # 去除所有空格
-                    sampling_id = re.sub(r'[^\w\.\-_/]', '', sampling_id)  # 只保留字母数字和常用符号
+                sampling_id = match.group(1).strip()
+                # 清理掉多余的空格和特殊字符，但保留点、横线、下划线
+                sampling_id = re.sub(r'\s+', '', sampling_id)  # 去除所有空格
+                sampling_id = re.sub(r'[^\w\.\-_/]', '', sampling_id)  # 只保留字母数字和常用符号
 
-                    if sampling_id:
-                        logger.info(f"提取到Sampling ID: '{sampling_id}'")
-                        return sampling_id
+                if sampling_id:
+                    logger.info(f"提取到Sampling ID: '{sampling_id}'")
+                    return sampling_id
 
         logger.warning("未找到Sampling ID")
         return None
@@ -488,70 +697,69 @@ class PDFProcessor:
     def _extract_report_no(self, text: str) -> Optional[str]:
         """提取Report No - 从同一行中提取关键词后的值"""
         lines = text.split('\n')
-        logger.debug(f"开始提取Report No，总行数: {len(lines)}")
+        logger.debug("开始提取Report No，总行数: %d", len(lines))
 
         for line_num, line in enumerate(lines):
             line = line.strip()
             if not line:
                 continue
 
-            # 查找包含 "Report No.:" 的行
-            if re.search(r'Report\s*No\.?\s*:', line, re.IGNORECASE):
-                logger.debug(f"找到Report No行 {line_num}: '{line}'")
+            # 查找包含 "Report No.:" 的行，并提取冒号后面的所有内容
+            match = self._report_no_patterns[0].search(line)
+            if match:
+                logger.debug("找到Report No行 %d: '%s'", line_num, line)
 
-                # 提取冒号后面的所有内容
-                match = re.search(r'Report\s*No\.?\s*:\s*(.+)', line, re.IGNORECASE)
-                if match:
-                    report_no = match.group(1).strip()
-                    # 清理掉多余的空格和特殊字符，但保留点、横线、下划线
-                    report_no = re.sub(r'\s+', '', report_no)  # 去除所有空格
-                    report_no = re.sub(r'[^\w\.\-_/]', '', report_no)  # 只保留字母数字和常用符号
+                report_no = match.group(1).strip()
+                # 清理掉多余的空格和特殊字符，但保留点、横线、下划线
+                report_no = re.sub(r'\s+', '', report_no)  # 去除所有空格
+                report_no = re.sub(r'[^\w\.\-_/]', '', report_no)  # 只保留字母数字和常用符号
 
-                    if report_no:
-                        logger.info(f"提取到Report No: '{report_no}'")
-                        return report_no
+                if report_no:
+                    logger.info(f"提取到Report No: '{report_no}'")
+                    return report_no
 
         logger.warning("未找到Report No")
         return None
 
-    def _extract_field_by_keyword(self, text: str, field_name: str) -> Optional[str]:
+    def _extract_field_by_keyword(self, text: str, field_name: str,
+                                  lines: Optional[List[tuple]] = None) -> Optional[str]:
         """
         通用字段提取方法，根据字段名动态提取PDF内容（优化版本）
 
         Args:
             text (str): PDF文本内容
             field_name (str): 要提取的字段名，如"Sampling ID"、"Report No"等
+            lines (List[tuple], optional): 预先筛选的(行号, 行)列表，见_filter_field_lines
 
         Returns:
             Optional[str]: 提取到的字段值，未找到则返回None
         """
-        logger.debug(f"开始提取字段 '{field_name}'")
-        lines = text.split('\n')
+        logger.debug("开始提取字段 '%s'", field_name)
+        if lines is None:
+            lines = enumerate(text.split('\n'))
 
         # 获取或创建字段模式（使用缓存优化性能）
         patterns = self._get_field_patterns(field_name)
 
-        for line_num, line in enumerate(lines):
+        for line_num, line in lines:
             line = line.strip()
             if not line:
                 continue
 
-            # 尝试所有模式
+            # 尝试所有模式（每个模式只执行一次search，复用匹配结果）
             for pattern in patterns:
-                if pattern.search(line):
-                    logger.debug(f"找到字段 '{field_name}' 在行 {line_num}: '{line}'")
+                match = pattern.search(line)
+                if match:
+                    logger.debug("找到字段 '%s' 在行 %d: '%s'", field_name, line_num, line)
 
-                    # 提取匹配的值
-                    match = pattern.search(line)
-                    if match:
-                        field_value = match.group(1).strip()
+                    field_value = match.group(1).strip()
 
-                        # 根据字段名进行特定的清理
-                        field_value = self._clean_field_value(field_value, field_name)
+                    # 根据字段名进行特定的清理
+                    field_value = self._clean_field_value(field_value, field_name)
 
-                        if field_value:
-                            logger.info(f"提取到字段 '{field_name}': '{field_value}'")
-                            return field_value
+                    if field_value:
+                        logger.info(f"提取到字段 '{field_name}': '{field_value}'")
+                        return field_value
 
         logger.warning(f"未找到字段 '{field_name}'")
         return None
@@ -566,12 +774,14 @@ class PDFProcessor:
         Returns:
             List: 编译后的正则表达式模式列表
         """
-        # 检查缓存
-        if field_name in self._field_pattern_cache:
-            return self._field_pattern_cache[field_name]
+        # 检查缓存（模式均为忽略大小写，按小写字段名缓存）
+        field_key = field_name.lower()
+        patterns = self._field_pattern_cache.get(field_key)
+        if patterns is not None:
+            return patterns
 
         # 处理特殊字段：Report No 的变体
-        if field_name.lower() in ["report no", "report number", "report no."]:
+        if field_key in _REPORT_NO_ALIASES:
             patterns = self._report_no_patterns
         else:
             # 为通用字段创建正则表达式模式
@@ -582,7 +792,7 @@ class PDFProcessor:
             ]
 
         # 缓存模式
-        self._field_pattern_cache[field_name] = patterns
+        self._field_pattern_cache[field_key] = patterns
         return patterns
 
     def _clean_field_value(self, value: str, field_name: str) -> str:
@@ -611,59 +821,124 @@ class PDFProcessor:
 
         return cleaned
 
-    def _extract_test_results(self, text: str) -> Dict[str, str]:
-        """提取测试方法和结论 - 按行处理"""
+    def _extract_test_results(self, text: str, short_circuit_on_fail: bool = False) -> Dict[str, str]:
+        """
+        提取测试方法和结论 - 按行处理
+
+        Args:
+            text (str): PDF文本内容
+            short_circuit_on_fail (bool): 某个测试方法结论为Fail时停止查找后续方法。
+                默认关闭：后续方法的"未找到结论"优先级高于Fail，且界面需要展示每个方法的结果
+
+        Returns:
+            Dict[str, str]: 测试方法到结论的映射
+        """
         test_results = {}
-        lines = text.split('\n')
+        lines = [line.strip() for line in text.split('\n')]
+        # 整个文本只编码并转小写一次；'\n'是单字节，按字节分割后的行号与lines一致
+        lines_bytes = _encode_lower(text).split(b'\n')
 
-        logger.debug(f"开始提取测试结果，总行数: {len(lines)}")
-        logger.debug(f"前20行内容: {lines[:20]}")
+        logger.debug("开始提取测试结果，总行数: %d", len(lines))
+        logger.debug("前20行内容: %s", lines[:20])
+
+        # 一次遍历文本，定位所有测试方法出现的行
+        method_hits = self._locate_test_methods(lines)
 
         for test_method in self.test_methods:
-            logger.debug(f"查找测试方法: {test_method}")
-            conclusion = self._find_conclusion_for_method_lines(lines, test_method)
+            logger.debug("查找测试方法: %s", test_method)
+            conclusion = self._find_conclusion_from_hits(lines, test_method, method_hits[test_method], lines_bytes)
             test_results[test_method] = conclusion
-            logger.debug(f"测试方法 '{test_method}' 结论: {conclusion}")
+            logger.debug("测试方法 '%s' 结论: %s", test_method, conclusion)
+
+            if short_circuit_on_fail and conclusion == 'Fail':
+                logger.debug("测试方法 '%s' 结论为Fail，跳过后续测试方法", test_method)
+                break
 
         return test_results
 
-    def _find_conclusion_for_method_lines(self, lines: List[str], test_method: str) -> str:
-        """为特定测试方法查找结论 - 按行处理版本"""
-        logger.debug(f"正在按行查找测试方法 '{test_method}' 的结论...")
+    def _get_test_method_pattern(self, test_method: str):
+        """获取测试方法的预编译模式（未预编译时即时编译并缓存）"""
+        pattern = self._test_method_patterns.get(test_method)
+        if pattern is None:
+            pattern = re.compile(re.escape(test_method), re.IGNORECASE)
+            self._test_method_patterns[test_method] = pattern
+        return pattern
 
-        method_found = False  # 标记是否找到了测试方法
+    def _locate_test_methods(self, lines: List[str], methods: List[str] = None) -> Dict[str, List[int]]:
+        """
+        单次遍历已strip的行，记录每个测试方法出现的行号
+
+        Args:
+            lines (List[str]): 已去除首尾空白的文本行
+            methods (List[str], optional): 要定位的测试方法，默认为全部已配置方法
+
+        Returns:
+            Dict[str, List[int]]: 测试方法到出现行号列表的映射
+        """
+        if methods is None:
+            methods = self.test_methods
+        patterns = [(method, self._get_test_method_pattern(method)) for method in methods]
+        method_hits = {method: [] for method in methods}
 
         for i, line in enumerate(lines):
-            line = line.strip()
             if not line:
                 continue
+            for method, pattern in patterns:
+                if pattern.search(line):
+                    method_hits[method].append(i)
 
-            # 查找包含测试方法的行
-            if re.search(re.escape(test_method), line, re.IGNORECASE):
-                logger.debug(f"找到测试方法 '{test_method}' 在行 {i}: '{line}'")
-                method_found = True
+        return method_hits
 
-                # 从当前行开始，向下查找包含Pass/Fail的行
-                for j in range(i + 1, min(i + 15, len(lines))):  # 向下查找15行
-                    search_line = lines[j].strip()
-                    if not search_line:
-                        continue
+    def _find_conclusion_for_method_lines(self, lines: List[str], test_method: str) -> str:
+        """为特定测试方法查找结论 - 按行处理版本"""
+        lines = [line.strip() for line in lines]
+        method_hits = self._locate_test_methods(lines, [test_method])
+        return self._find_conclusion_from_hits(lines, test_method, method_hits[test_method])
+
+    def _find_conclusion_from_hits(self, lines: List[str], test_method: str, hit_lines: List[int],
+                                   lines_bytes: List[bytes] = None) -> str:
+        """
+        在测试方法出现行之后的有限窗口内查找结论
+
+        Args:
+            lines (List[str]): 已去除首尾空白的文本行
+            test_method (str): 测试方法名
+            hit_lines (List[int]): 测试方法出现的行号
+            lines_bytes (List[bytes], optional): 与lines对应的小写UTF-8字节行，避免逐行重复编码
+
+        Returns:
+            str: 'Pass'、'Fail'、'未找到方法'或'未找到结论'
+        """
+        logger.debug("正在按行查找测试方法 '%s' 的结论...", test_method)
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+        for i in hit_lines:
+            logger.debug("找到测试方法 '%s' 在行 %d: '%s'", test_method, i, lines[i])
 
-                    logger.debug(f"检查行 {j}: '{search_line}'")
+            # 从当前行开始，向下查找包含Pass/Fail的行
+            for j in range(i + 1, min(i + 15, len(lines))):  # 向下查找15行
+                search_line = lines[j]
+                if not search_line:
+                    continue
 
-                    # 检查该行是否包含Pass/Fail关键词
+                logger.debug("检查行 %d: '%s'", j, search_line)
+
+                # 检查该行是否包含Pass/Fail关键词
+                if lines_bytes is not None:
+                    conclusion = self._match_conclusion_bytes(lines_bytes[j])
+                else:
                     conclusion = self._extract_conclusion_from_line(search_line)
-                    if conclusion in ['Pass', 'Fail']:  # 只接受Pass或Fail
-                        logger.info(f"测试方法 '{test_method}' 找到结论: {conclusion}")
-                        return conclusion
-                    else:
-                        # 如果该行不包含结论，但有大量描述性文本，可能不是我们想要的结论
-                        if len(search_line) > 50 and not any(keyword in search_line.lower()
-                            for keyword in ['pass', 'fail', 'compliant', 'non-compliant', '符合', '不合格']):
-                            logger.debug(f"行 {j} 包含描述性文本，跳过: '{search_line[:50]}...'")
+                if conclusion in ['Pass', 'Fail']:  # 只接受Pass或Fail
+                    logger.info(f"测试方法 '{test_method}' 找到结论: {conclusion}")
+                    return conclusion
+                elif debug_enabled:
+                    # 如果该行不包含结论，但有大量描述性文本，可能不是我们想要的结论（仅用于调试日志）
+                    if len(search_line) > 50 and not any(keyword in search_line.lower()
+                        for keyword in ['pass', 'fail', 'compliant', 'non-compliant', '符合', '不合格']):
+                        logger.debug("行 %d 包含描述性文本，跳过: '%s...'", j, search_line[:50])
 
         # 根据是否找到测试方法返回不同的结果
-        if not method_found:
+        if not hit_lines:
             logger.warning(f"未找到测试方法 '{test_method}'")
             return '未找到方法'
         else:
@@ -672,20 +947,18 @@ class PDFProcessor:
 
     def _extract_conclusion_from_line(self, line: str) -> Optional[str]:
         """从行中提取结论"""
-        pass_keywords = ['pass', 'compliant', '符合', '合格', '通过', 'ok', 'yes']
-        fail_keywords = ['fail', 'non-compliant', '不符合', '不合格', '不通过', 'failed', 'no', 'ng']
-
-        line_lower = line.lower()
+        # 整行只编码一次并按字节转小写，关键词检索使用bytes.find
+        return self._match_conclusion_bytes(_encode_lower(line))
 
+    def _match_conclusion_bytes(self, line_bytes: bytes) -> Optional[str]:
+        """在已转小写的UTF-8字节行中检索结论关键词"""
         # 先检查Fail关键词（优先级更高）
-        for keyword in fail_keywords:
-            if keyword in line_lower:
-                return 'Fail'
+        if any(line_bytes.find(keyword) >= 0 for keyword in self._fail_keys_b):
+            return 'Fail'
 
         # 再检查Pass关键词
-        for keyword in pass_keywords:
-            if keyword in line_lower:
-                return 'Pass'
+        if any(line_bytes.find(keyword) >= 0 for keyword in self._pass_keys_b):
+            return 'Pass'
 
         return None
 
@@ -799,20 +1072,21 @@ class PDFProcessor:
         if not rule:
             rule = "-".join(self.info_field_list)
 
-        # 按"-"分隔符分割规则
-        rule_fields = [field.strip() for field in rule.split('-') if field.strip()]
+        # 按"-"分隔符分割规则（同一批次规则不变，使用缓存）
+        rule_fields = self._parse_rule(rule)
 
         # 按"-"分隔符分割文件名
-        filename_parts = [part.strip() for part in filename.split('-') if part.strip()]
+        filename_parts = [part for part in map(str.strip, filename.split('-')) if part]
+        part_count = len(filename_parts)
 
-        logger.info(f"规则字段: {rule_fields}")
+        logger.info(f"规则字段: {list(rule_fields)}")
         logger.info(f"文件名分割结果: {filename_parts}")
 
         result = {}
 
         # 根据规则字段和文件名部分进行映射
         for i, field_name in enumerate(rule_fields):
-            if i < len(filename_parts):
+            if i < part_count:
                 result[field_name] = filename_parts[i]
                 logger.debug(f"字段映射: {field_name} = {filename_parts[i]}")
             else:
@@ -829,6 +1103,20 @@ class PDFProcessor:
         logger.info(f"文件名解析完成: {result}")
         return result
 
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _parse_rule(rule: str) -> tuple:
+        """
+        按"-"分割命名规则并缓存结果（同一批次通常只有一两条规则）
+
+        Args:
+            rule (str): 命名规则，如"Sampling ID-Report No-结论"
+
+        Returns:
+            tuple: 去除空白并驻留（intern）后的规则字段
+        """
+        return tuple(sys.intern(field) for field in map(str.strip, rule.split('-')) if field)
+
     def _extract_conclusion_from_filename(self, filename: str) -> Optional[str]:
         """从文件名中提取结论"""
         filename_lower = filename.lower()
@@ -860,35 +1148,14 @@ class PDFProcessor:
             str: 重排后的文件名（包含扩展名）
         """
         try:
-            logger.info(f"=== rearrange_fields_by_rule 调试开始 ===")
-            logger.info(f"接收到的规则: '{rule}'")
-            logger.info(f"接收到的扩展名: '{extension}'")
-            logger.info(f"接收到的field_values: {field_values}")
-            logger.info(f"field_values字典长度: {len(field_values)}")
-            logger.info(f"field_values所有键: {list(field_values.keys())}")
-
-            # 详细分析每个字段值的质量
-            for key, value in field_values.items():
-                if value and value != "无":
-                    logger.info(f"✓ 有效字段 '{key}': '{value}' (长度: {len(value)})")
-                else:
-                    logger.warning(f"✗ 无效字段 '{key}': '{value}'")
-
-            # 检查关键字段是否存在
-            for key in ['Sampling ID', 'Report No', '最终结论', '结论']:
-                if key in field_values and field_values[key] and field_values[key] != "无":
-                    logger.info(f"✓ rearrange_fields找到关键字段 '{key}': '{field_values[key]}'")
-                else:
-                    logger.warning(f"✗ rearrange_fields未找到有效字段 '{key}'")
-                    # 检查相似字段名
-                    similar_keys = [k for k in field_values.keys() if key.lower() in k.lower() or k.lower() in key.lower()]
-                    if similar_keys:
-                        logger.warning(f"  找到相似字段名: {similar_keys}")
-                        for similar_key in similar_keys:
-                            logger.warning(f"    {similar_key}: '{field_values[similar_key]}'")
-
-            logger.debug(f"字段重排开始: 规则='{rule}', 扩展名='{extension}'")
-            logger.debug(f"可用字段值: {field_values}")
+            # 调试信息只在DEBUG级别启用时构建，避免每个文件格式化整个字段字典
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("=== rearrange_fields_by_rule 调试开始 ===")
+                logger.debug("字段重排开始: 规则='%s', 扩展名='%s'", rule, extension)
+                logger.debug("可用字段值(%d): %s", len(field_values), field_values)
+                valid_keys = [key for key, value in field_values.items() if value and value != "无"]
+                invalid_keys = [key for key, value in field_values.items() if not value or value == "无"]
+                logger.debug("有效字段: %s, 无效字段: %s", valid_keys, invalid_keys)
 
             if not rule:
                 logger.warning("规则为空，使用默认文件名")
@@ -897,40 +1164,46 @@ class PDFProcessor:
             # 处理单字段情况（没有"-"分隔符）
             if '-' not in rule:
                 single_field = rule.strip()
-                logger.debug(f"检测到单字段规则: '{single_field}'")
-                result = self._validate_field_value(single_field, field_values)
+                logger.debug("检测到单字段规则: '%s'", single_field)
+                result = self._validate_field_value(single_field, field_values, self._build_fv_lower(field_values))
                 if result.startswith("UNKNOWN_"):
-                    logger.warning(f"单字段 '{single_field}' 值为空，使用占位符: {result}")
+                    logger.warning("单字段 '%s' 值为空，使用占位符: %s", single_field, result)
 
                 # 确保添加扩展名
                 if extension and not result.lower().endswith(extension.lower()):
                     result += extension
 
-                logger.info(f"单字段重排结果: {result}")
+                logger.info("单字段重排结果: %s", result)
                 return result
 
             # 按"-"分隔符分割规则
-            rule_fields = [field.strip() for field in rule.split('-') if field.strip()]
+            rule_fields = self._parse_rule(rule)
 
-            logger.debug(f"解析后的规则字段列表: {rule_fields}")
+            logger.debug("解析后的规则字段列表: %s", rule_fields)
 
-            # 根据规则重排字段
-            filename_parts = []
+            # 小写字段名映射每个文件只构建一次，供所有规则字段复用
+            fv_lower = self._build_fv_lower(field_values)
+
+            # 根据规则重排字段（结果列表按字段数预分配）
+            field_count = len(rule_fields)
+            filename_parts = [""] * field_count
             for i, field_name in enumerate(rule_fields):
-                logger.debug(f"处理字段 {i+1}/{len(rule_fields)}: '{field_name}'")
+                logger.debug("处理字段 %d/%d: '%s'", i + 1, field_count, field_name)
 
-                value = self._validate_field_value(field_name, field_values)
-                filename_parts.append(value)
+                value = self._validate_field_value(field_name, field_values, fv_lower)
+                filename_parts[i] = value
 
                 if value.startswith("UNKNOWN_"):
-                    logger.warning(f"字段 '{field_name}' 值为空，使用占位符: {value}")
-                    # 尝试查找相似字段名
-                    available_fields = list(field_values.keys())
-                    similar_fields = [f for f in available_fields if field_name.lower() in f.lower() or f.lower() in field_name.lower()]
-                    if similar_fields:
-                        logger.warning(f"发现相似字段名: {similar_fields}")
+                    if logger.isEnabledFor(logging.WARNING):
+                        logger.warning("字段 '%s' 值为空，使用占位符: %s", field_name, value)
+                        # 尝试查找相似字段名
+                        field_lower = field_name.lower()
+                        similar_fields = [f for f in field_values
+                                          if field_lower in f.lower() or f.lower() in field_lower]
+                        if similar_fields:
+                            logger.warning("发现相似字段名: %s", similar_fields)
                 else:
-                    logger.debug(f"字段 '{field_name}' 成功添加到文件名: '{value}'")
+                    logger.debug("字段 '%s' 成功添加到文件名: '%s'", field_name, value)
 
             # 用"-"连接各部分
             new_filename = "-".join(filename_parts)
@@ -942,7 +1215,7 @@ class PDFProcessor:
             if extension and not new_filename.lower().endswith(extension.lower()):
                 new_filename += extension
 
-            logger.info(f"字段重排完成: '{rule}' -> '{new_filename}'")
+            logger.info("字段重排完成: '%s' -> '%s'", rule, new_filename)
             return new_filename
 
         except Exception as e:
@@ -950,98 +1223,139 @@ class PDFProcessor:
             logger.error(f"错误详情: 规则='{rule}', 字段值={field_values}")
             return "ERROR_RENAME"
 
-    def _validate_field_value(self, field_name: str, field_values: Dict[str, str]) -> str:
+    def prepare_rename(self, rule: str, extension: str = ".pdf") -> Callable[[Dict[str, str]], str]:
+        """
+        针对固定的命名规则预先完成规则解析，返回批量重命名用的函数
+
+        规则分割、单字段判断和扩展名小写都只做一次，返回的函数对每个文件
+        只需解析字段值并拼接，结果与rearrange_fields_by_rule一致。
+
+        Args:
+            rule (str): 字段排列规则，如"Report No-结论-Sampling ID"
+            extension (str): 文件扩展名，默认为".pdf"
+
+        Returns:
+            Callable[[Dict[str, str]], str]: 接收字段值映射、返回文件名的函数
+        """
+        ext_lower = extension.lower() if extension else ""
+        single_field = rule.strip() if rule and '-' not in rule else None
+        rule_fields = self._parse_rule(rule) if rule and single_field is None else ()
+        validate = self._validate_field_value
+        build_fv_lower = self._build_fv_lower
+        sanitize = self.sanitize_filename
+
+        def _rename(field_values: Dict[str, str]) -> str:
+            if not rule:
+                logger.warning("规则为空，使用默认文件名")
+                return "RENAMED_FILE"
+
+            try:
+                fv_lower = build_fv_lower(field_values)
+                if single_field is not None:
+                    # 单字段规则不做文件名清理，与rearrange_fields_by_rule保持一致
+                    new_filename = validate(single_field, field_values, fv_lower)
+                else:
+                    new_filename = sanitize("-".join([validate(field_name, field_values, fv_lower)
+                                                      for field_name in rule_fields]))
+
+                if ext_lower and not new_filename.lower().endswith(ext_lower):
+                    new_filename += extension
+
+                logger.info("字段重排完成: '%s' -> '%s'", rule, new_filename)
+                return new_filename
+
+            except Exception as e:
+                logger.error("重排字段失败: %s", e)
+                logger.error("错误详情: 规则='%s', 字段值=%s", rule, field_values)
+                return "ERROR_RENAME"
+
+        return _rename
+
+    def _validate_field_value(self, field_name: str, field_values: Dict[str, str],
+                              fv_lower: Dict[str, str] = None) -> str:
         """
         验证字段值并返回有效值或占位符
 
         Args:
             field_name (str): 字段名称
             field_values (Dict[str, str]): 字段值字典
+            fv_lower (Dict[str, str], optional): 小写字段名到有效值的映射（见_build_fv_lower），
+                由调用方每个文件构建一次后传入
 
         Returns:
             str: 有效字段值或占位符
         """
-        logger.debug(f"验证字段: '{field_name}', 可用字段: {list(field_values.keys())}")
-
-        # 字段名映射表 - 处理常见的字段名变体
-        field_mapping = {
-            # 报告编号变体
-            'Test Report No': 'Report No',
-            'Report No': 'Report No',
-            'Report Number': 'Report No',
-            '报告编号': 'Report No',
-
-            # SKU ID变体
-            'SKU ID': 'Sampling ID',
-            'SKU': 'Sampling ID',
-            'Sku': 'Sampling ID',
-            'sku': 'Sampling ID',
-            'SKU No': 'Sampling ID',
-
-            # Goods ID变体
-            'Goods ID': 'Report No',
-            'Goods No': 'Report No',
-            'Product ID': 'Report No',
-            'Product No': 'Report No',
-
-            # 结论变体
-            'Overall Conclusion': '结论',
-            'Conclusion': '结论',
-            'Final Conclusion': '结论',
-            '最终结论': '结论',
-            'Test Result': '结论',
-            'Result': '结论',
-        }
+        logger.debug("验证字段: '%s', 可用字段: %s", field_name, field_values.keys())
+
+        if fv_lower is None:
+            fv_lower = self._build_fv_lower(field_values)
+        fn_lower = field_name.lower()
 
         # 1. 直接查找
         value = field_values.get(field_name)
         if value and value != "无":
-            logger.debug(f"直接匹配成功: '{field_name}' = '{value}'")
+            logger.debug("直接匹配成功: '%s' = '%s'", field_name, value)
             return value
 
         # 2. 使用字段映射表
-        mapped_field = field_mapping.get(field_name)
+        mapped_field = _FIELD_MAPPING.get(field_name)
         if mapped_field:
             value = field_values.get(mapped_field)
             if value and value != "无":
-                logger.debug(f"映射匹配成功: '{field_name}' -> '{mapped_field}' = '{value}'")
+                logger.debug("映射匹配成功: '%s' -> '%s' = '%s'", field_name, mapped_field, value)
                 return value
 
-        # 3. 尝试大小写不敏感匹配
-        for key, val in field_values.items():
-            if key.lower() == field_name.lower() and val and val != "无":
-                logger.debug(f"大小写不敏感匹配: '{field_name}' -> '{key}' = '{val}'")
-                return val
-
-        # 4. 尝试映射表的大小写不敏感匹配
-        for key, val in field_values.items():
-            for original, mapped in field_mapping.items():
-                if (key.lower() == mapped.lower() and
-                    original.lower() == field_name.lower() and
-                    val and val != "无"):
-                    logger.debug(f"映射大小写匹配: '{field_name}' -> '{key}' = '{val}'")
-                    return val
+        # 3. 大小写不敏感查找：先按字段名本身，再按别名表得到的标准字段名
+        value = fv_lower.get(fn_lower)
+        if value:
+            logger.debug("大小写不敏感匹配: '%s' = '%s'", field_name, value)
+            return value
 
-        # 5. 尝试包含匹配
-        for key, val in field_values.items():
-            if field_name.lower() in key.lower() or key.lower() in field_name.lower():
-                if val and val != "无":
-                    logger.debug(f"包含匹配成功: '{field_name}' -> '{key}' = '{val}'")
+        canonical = _ALIAS_TO_CANONICAL.get(fn_lower, fn_lower)
+        if canonical != fn_lower:
+            value = fv_lower.get(canonical)
+            if value:
+                logger.debug("映射大小写匹配: '%s' -> '%s' = '%s'", field_name, canonical, value)
+                return value
+
+        # 4. 包含匹配（仅在查找失败时执行，可通过enable_fuzzy_field_match关闭）
+        if self.enable_fuzzy_field_match:
+            for key_lower, val in fv_lower.items():
+                if fn_lower in key_lower or key_lower in fn_lower:
+                    logger.debug("包含匹配成功: '%s' -> '%s' = '%s'", field_name, key_lower, val)
                     return val
 
-        # 6. 尝试通过映射表的包含匹配
-        for mapped_key, target_key in field_mapping.items():
-            if field_name.lower() == mapped_key.lower():
-                for key, val in field_values.items():
-                    if (target_key.lower() in key.lower() or key.lower() in target_key.lower()) and val and val != "无":
-                        logger.debug(f"映射包含匹配: '{field_name}' -> '{target_key}' -> '{key}' = '{val}'")
+            if canonical != fn_lower:
+                for key_lower, val in fv_lower.items():
+                    if canonical in key_lower or key_lower in canonical:
+                        logger.debug("映射包含匹配: '%s' -> '%s' -> '%s' = '%s'", field_name, canonical, key_lower, val)
                         return val
 
-        logger.warning(f"字段 '{field_name}' 匹配失败，使用占位符")
+        logger.warning("字段 '%s' 匹配失败，使用占位符", field_name)
 
-        # 预计算占位符字段名，避免重复字符串操作
-        placeholder_name = field_name.replace(' ', '_').upper()
-        return f"UNKNOWN_{placeholder_name}"
+        # 同一字段名的占位符只生成一次
+        placeholder = self._placeholder_cache.get(field_name)
+        if placeholder is None:
+            placeholder = f"UNKNOWN_{field_name.replace(' ', '_').upper()}"
+            self._placeholder_cache[field_name] = placeholder
+        return placeholder
+
+    @staticmethod
+    def _build_fv_lower(field_values: Dict[str, str]) -> Dict[str, str]:
+        """
+        构建小写字段名到有效值的映射，同名（忽略大小写）时保留字典顺序中第一个有效值
+
+        Args:
+            field_values (Dict[str, str]): 字段值字典
+
+        Returns:
+            Dict[str, str]: 小写字段名 -> 有效字段值（排除空值和"无"）
+        """
+        fv_lower = {}
+        for key, value in field_values.items():
+            if value and value != "无":
+                fv_lower.setdefault(sys.intern(key.lower()), value)
+        return fv_lower
 
     def generate_new_filename(self, sampling_id: str, report_no: str, final_conclusion: str) -> str:
         """生成新文件名：Sampling ID-Report No-最终结论.pdf"""
@@ -1054,4 +1368,85 @@ class PDFProcessor:
         logger.info(f"生成新文件名: {new_filename}")
         return new_filename
 
-  
\ No newline at end of file
+
+# 文件数少于该值时直接在当前进程处理：Windows下工作进程以spawn方式启动，进程池的启动开销大于并行收益
+_MIN_PARALLEL_FILES = 16
+
+# 工作进程内的处理器实例（每个进程只构建一次，字段模式缓存和合并正则在进程内复用）
+_worker_processor = None
+
+
+def _create_processor(config: Dict[str, Any]) -> PDFProcessor:
+    """根据get_batch_config导出的配置创建PDFProcessor"""
+    processor = PDFProcessor(
+        info_fields=config.get('info_fields'),
+        enable_test_analysis=config.get('enable_test_analysis', True)
+    )
+    processor.enable_fuzzy_field_match = config.get('enable_fuzzy_field_match', True)
+    test_methods = config.get('test_methods')
+    if test_methods:
+        processor.set_test_methods(test_methods)
+    return processor
+
+
+def _init_worker(config: Dict[str, Any]):
+    """多进程工作进程初始化：按配置构建一个PDFProcessor"""
+    global _worker_processor
+    _worker_processor = _create_processor(config)
+
+
+def _worker_extract(task: tuple) -> tuple:
+    """工作进程任务：提取单个PDF信息，返回(序号, 结果)"""
+    index, pdf_path = task
+    return index, _worker_processor.extract_pdf_info(pdf_path)
+
+
+def process_pdf_batch(pdf_paths: List[str], config: Dict[str, Any] = None,
+                      processes: Optional[int] = None,
+                      progress_callback: Optional[Callable[[int, int], None]] = None) -> List[Dict[str, Any]]:
+    """
+    多进程批量提取PDF信息
+
+    打包后的exe使用本函数时，入口脚本需在__main__中先调用multiprocessing.freeze_support()
+
+    Args:
+        pdf_paths (List[str]): PDF文件路径列表
+        config (Dict[str, Any], optional): 处理器配置，通常为PDFProcessor.get_batch_config()的返回值
+        processes (int, optional): 进程数，默认为CPU核心数
+        progress_callback (Callable[[int, int], None], optional): 每完成一个文件调用一次，参数为(已完成数, 总数)
+
+    Returns:
+        List[Dict[str, Any]]: 与pdf_paths顺序一致的extract_pdf_info结果列表
+    """
+    config = config or {}
+    total = len(pdf_paths)
+    if not total:
+        return []
+
+    processes = min(processes or os.cpu_count() or 1, total)
+    results = [None] * total
+
+    if processes > 1 and total >= _MIN_PARALLEL_FILES:
+        logger.info(f"开始多进程批量处理，文件数: {total}, 进程数: {processes}")
+        # 每个进程至少分到几批任务，避免chunksize过大导致尾部负载不均
+        chunksize = max(1, min(8, total // (processes * 4)))
+        try:
+            with multiprocessing.Pool(processes=processes, initializer=_init_worker,
+                                      initargs=(config,)) as pool:
+                for done, (index, result) in enumerate(
+                        pool.imap_unordered(_worker_extract, enumerate(pdf_paths), chunksize=chunksize), 1):
+                    results[index] = result
+                    if progress_callback:
+                        progress_callback(done, total)
+            return results
+        except (OSError, multiprocessing.ProcessError) as e:
+            # 进程池无法启动时回退到单进程，已完成的结果保留
+            logger.warning(f"多进程处理失败，回退到单进程处理: {e}")
+
+    processor = _create_processor(config)
+    for index, pdf_path in enumerate(pdf_paths):
+        if results[index] is None:
+            results[index] = processor.extract_pdf_info(pdf_path)
+        if progress_callback:
+            progress_callback(index + 1, total)
+    return results
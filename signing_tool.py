@@ -11,16 +11,23 @@
     success, message = tool.sign_file("app.exe")
 """
 import os
+import re
 import sys
-import subprocess
+import shutil
 import time
 import json
 import glob
+import fnmatch
+import threading
 import hashlib
 from pathlib import Path
-from code_signer.utils import safe_subprocess_run
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from code_signer.utils import safe_subprocess_run, sdk_version_key
 from code_signer.config_loader import load_signing_config, get_config_load_info
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Set, Tuple, Optional, Any
+
+# 配置路径不存在的标记：_config_cache中缓存该值，同一缺失路径不再重复遍历配置对象
+_MISSING = object()
 
 
 class SigningTool:
@@ -34,6 +41,20 @@ class SigningTool:
         self.config_path = config_path
         self.signing_records = []
 
+        # 批量签名时记录先缓存在内存中，结束后一次性写入
+        self._batch_mode = False
+        self._pending_records: List[Dict[str, Any]] = []
+        self._records_lock = threading.Lock()  # 并发签名时保护记录列表
+
+        # 签名工具路径缓存：批量签名时只查找一次
+        self._signtool_cache: Optional[str] = None
+        self._osslsigncode_cache: Optional[str] = None
+        self._signing_tool_cache: Dict[Optional[str], str] = {}
+        # 文件哈希缓存：(路径, 大小, 修改时间) -> sha256
+        self._hash_cache: Dict[Tuple[str, int, float], str] = {}
+        # 已确认存在于证书库中的证书SHA1，同一会话内不再重复调用certutil
+        self._cert_verified: Set[str] = set()
+
         # 使用新的配置加载器
         try:
             self.config_obj = load_signing_config(config_path)
@@ -49,6 +70,9 @@ class SigningTool:
             else:
                 print("[信息] 配置验证通过")
 
+            # 配置路径解析结果缓存：同一路径只按属性遍历一次
+            self._config_cache: Dict[str, Any] = {}
+
         except Exception as e:
             print(f"[错误] 初始化签名工具失败: {e}")
             print("请确保 code_signer 模块和配置文件存在且格式正确")
@@ -61,6 +85,15 @@ class SigningTool:
         :param default: 默认值
         :return: 配置值
         """
+        value = self._config_cache.get(key_path, _MISSING)
+        if value is _MISSING and key_path not in self._config_cache:
+            # 首次访问该路径：按属性遍历，并缓存结果（不存在的路径也缓存为_MISSING）
+            value = self._resolve_config_path(key_path)
+            self._config_cache[key_path] = value
+        return default if value is _MISSING else value
+
+    def _resolve_config_path(self, key_path: str) -> Any:
+        """按属性逐级遍历配置对象，路径不存在时返回_MISSING"""
         try:
             # 支持新的配置对象访问方式
             if hasattr(self.config_obj, key_path):
@@ -76,12 +109,12 @@ class SigningTool:
                 elif hasattr(value, '__dict__') and key in value.__dict__:
                     value = value.__dict__[key]
                 else:
-                    return default
+                    return _MISSING
 
             return value
 
         except Exception:
-            return default
+            return _MISSING
 
     
     def find_signing_tool(self, tool_name: str = None) -> Optional[str]:
@@ -90,6 +123,10 @@ class SigningTool:
         :param tool_name: 工具名称，如果为None则按优先级查找第一个可用的
         :return: 工具路径，如果未找到返回None
         """
+        cached = self._signing_tool_cache.get(tool_name)
+        if cached:
+            return cached
+
         # 使用新的配置对象
         tools = self.config_obj.signing_tools
 
@@ -118,6 +155,7 @@ class SigningTool:
                 continue
 
             if path:
+                self._signing_tool_cache[tool_name] = path
                 return path
 
         return None
@@ -125,7 +163,10 @@ class SigningTool:
     def _find_signtool(self, path_config: str) -> Optional[str]:
         """查找signtool.exe"""
         if path_config != 'auto':
-            return path_config if os.path.exists(path_config) else None
+            return path_config if os.path.isfile(path_config) else None
+
+        if self._signtool_cache is not None:
+            return self._signtool_cache
 
         try:
             search_paths = [
@@ -134,9 +175,11 @@ class SigningTool:
             ]
 
             for pattern in search_paths:
-                matches = glob.glob(pattern)
-                if matches:
-                    return matches[-1]  # 使用最新版本
+                # 按SDK版本号取最新版本，iglob逐个产出匹配而不构建完整列表
+                latest = max(glob.iglob(pattern), key=sdk_version_key, default=None)
+                if latest:
+                    self._signtool_cache = latest
+                    return self._signtool_cache
         except Exception:
             pass
 
@@ -145,18 +188,17 @@ class SigningTool:
     def _find_osslsigncode(self, path_config: str) -> Optional[str]:
         """查找osslsigncode"""
         if path_config != 'auto':
-            return path_config if os.path.exists(path_config) else None
+            return path_config if os.path.isfile(path_config) else None
 
-        # 在PATH中查找
-        try:
-            result = subprocess.run(['where', 'osslsigncode'],
-                                  capture_output=True, text=True)
-            if result.returncode == 0:
-                return result.stdout.strip().split('\n')[0]
-        except Exception:
-            pass
+        if self._osslsigncode_cache is not None:
+            return self._osslsigncode_cache
 
-        return None
+        # 在PATH中查找（进程内完成，不再启动 where 子进程；
+        # shutil.which 在Windows上同样按PATHEXT匹配，结果与 where 的第一行一致）
+        found = shutil.which('osslsigncode')
+        if found:
+            self._osslsigncode_cache = found
+        return found
 
     def get_certificate_config(self, cert_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -176,10 +218,17 @@ class SigningTool:
         if not cert_config or not cert_config.get('sha1'):
             return False
 
+        sha1 = cert_config['sha1']
+        if sha1 in self._cert_verified:
+            return True
+
         try:
-            cmd = ['certutil', '-user', '-store', 'My', cert_config['sha1']]
+            cmd = ['certutil', '-user', '-store', 'My', sha1]
             result = safe_subprocess_run(cmd, encoding='utf-8')
-            return result.returncode == 0
+            if result.returncode == 0:
+                self._cert_verified.add(sha1)
+                return True
+            return False
         except Exception:
             return False
 
@@ -193,12 +242,17 @@ class SigningTool:
         search_patterns = self.get_config('signature.file_paths.search_patterns', ['*.exe'])
         exclude_patterns = self.get_config('signature.file_paths.exclude_patterns', [])
 
+        # 所有排除模式合并为一个正则，每个文件只匹配一次
+        exclude_re = None
+        if exclude_patterns:
+            exclude_re = re.compile('|'.join(
+                f'(?:{fnmatch.translate(os.path.normcase(p))})' for p in exclude_patterns))
+
         for pattern in search_patterns:
             pattern_path = os.path.join(search_dir, pattern)
             for file_path in glob.glob(pattern_path):
                 # 检查排除模式
-                if any(glob.fnmatch.fnmatch(os.path.basename(file_path), exclude_pattern)
-                      for exclude_pattern in exclude_patterns):
+                if exclude_re and exclude_re.match(os.path.normcase(os.path.basename(file_path))):
                     continue
                 files.append(file_path)
 
@@ -266,6 +320,12 @@ class SigningTool:
         if not self.get_config('signature.enabled', False):
             return False, "[错误] 签名功能未启用"
 
+        # 签名策略只读取一次
+        verify_before_sign = self.get_config('signature.policies.verify_before_sign', True)
+        max_retries = self.get_config('signature.policies.max_retries', 3)
+        auto_retry = self.get_config('signature.policies.auto_retry', True)
+        record_history = self.get_config('signature.policies.record_signing_history', True)
+
         if not os.path.exists(file_path):
             return False, f"[错误] 文件不存在: {file_path}"
 
@@ -277,13 +337,12 @@ class SigningTool:
         if not cert_config:
             return False, f"[错误] 未找到证书配置: {cert_name}"
 
-        # 验证证书是否存在
-        if self.get_config('signature.policies.verify_before_sign', True):
+        if verify_before_sign:
+            # 验证证书是否存在
             if not self.verify_certificate_exists(cert_config):
                 return False, f"[错误] 证书不存在或无法访问: {cert_config.get('name', cert_name)}"
 
-        # 验证文件是否已签名
-        if self.get_config('signature.policies.verify_before_sign', True):
+            # 验证文件是否已签名
             if self.verify_signature(file_path)[0]:
                 return False, f"[警告] 文件已有签名: {file_path}"
 
@@ -293,9 +352,7 @@ class SigningTool:
             return False, "[错误] 未找到可用的签名工具"
 
         # 执行签名
-        max_retries = self.get_config('signature.policies.max_retries', 3)
-        auto_retry = self.get_config('signature.policies.auto_retry', True)
-
+        # 证书和已有签名的检查都在重试循环之外，重试时只重新执行签名命令
         for attempt in range(max_retries):
             if tool_path.endswith('signtool.exe'):
                 success, message = self.sign_file_with_signtool(file_path, cert_config)
@@ -312,7 +369,7 @@ class SigningTool:
                 time.sleep(attempt + 1)
 
         # 保存签名记录
-        if success and self.get_config('signature.policies.record_signing_history', True):
+        if success and record_history:
             self.save_signing_record(file_path, cert_name, success, message)
 
         return success, message
@@ -348,10 +405,12 @@ class SigningTool:
         :param message: 消息
         """
         cert_config = self.get_certificate_config(cert_name)
+        save_records = self.get_config('signature.output.save_records', True)
 
         record = {
             "file_path": file_path,
-            "file_hash": self._calculate_file_hash(file_path),
+            # 不保存记录时不计算哈希，避免对大文件做一次完整读取
+            "file_hash": self._get_file_hash(file_path) if save_records else "",
             "certificate_name": cert_name,
             "certificate_sha1": cert_config.get('sha1', '') if cert_config else '',
             "signing_time": time.strftime("%Y-%m-%d %H:%M:%S"),
@@ -361,10 +420,13 @@ class SigningTool:
             "config_file": self.config_path
         }
 
-        self.signing_records.append(record)
+        with self._records_lock:
+            self.signing_records.append(record)
+            if save_records and self._batch_mode:
+                self._pending_records.append(record)
 
-        # 保存到文件
-        if self.get_config('signature.output.save_records', True):
+        # 保存到文件（批量模式下由flush_records统一写入）
+        if save_records and not self._batch_mode:
             record_dir = self.get_config('signature.file_paths.record_directory', './signature_records')
             os.makedirs(record_dir, exist_ok=True)
 
@@ -380,11 +442,59 @@ class SigningTool:
             except Exception as e:
                 print(f"[警告] 保存签名记录失败: {e}")
 
+    def flush_records(self) -> Optional[str]:
+        """
+        将批量签名期间缓存的记录一次性写入JSONL文件
+        :return: 记录文件路径，没有待写入记录时返回None
+        """
+        with self._records_lock:
+            pending, self._pending_records = self._pending_records, []
+        if not pending:
+            return None
+
+        record_dir = self.get_config('signature.file_paths.record_directory', './signature_records')
+        os.makedirs(record_dir, exist_ok=True)
+        record_file = os.path.join(record_dir, f"batch_{time.strftime('%Y%m%d_%H%M%S')}.jsonl")
+
+        try:
+            content = "\n".join(json.dumps(r, ensure_ascii=False) for r in pending) + "\n"
+            with open(record_file, "a", encoding="utf-8") as f:
+                f.write(content)
+
+            if self.get_config('signature.output.verbose', False):
+                print(f"[记录] {len(pending)} 条签名记录已保存到: {record_file}")
+            return record_file
+        except Exception as e:
+            print(f"[警告] 保存签名记录失败: {e}")
+            return None
+
+    def _get_file_hash(self, file_path: str) -> str:
+        """获取文件哈希，文件大小和修改时间未变时复用上次结果"""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return ""
+
+        key = (os.path.abspath(file_path), stat.st_size, stat.st_mtime)
+        file_hash = self._hash_cache.get(key)
+        if file_hash is None:
+            file_hash = self._calculate_file_hash(file_path)
+            if file_hash:
+                self._hash_cache[key] = file_hash
+        return file_hash
+
     def _calculate_file_hash(self, file_path: str) -> str:
-        """计算文件哈希"""
+        """计算文件哈希（分块读取，避免将整个文件载入内存）"""
         try:
-            with open(file_path, 'rb') as f:
-                return hashlib.sha256(f.read()).hexdigest()
+            with open(file_path, 'rb', buffering=0) as f:
+                # Python 3.11+ 的 file_digest 在C层完成读取和哈希
+                if hasattr(hashlib, 'file_digest'):
+                    return hashlib.file_digest(f, 'sha256').hexdigest()
+
+                sha256 = hashlib.sha256()
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    sha256.update(chunk)
+                return sha256.hexdigest()
         except Exception:
             return ""
 
@@ -413,29 +523,48 @@ class SigningTool:
         print(f"描述: {cert_config.get('description', 'N/A')}")
         print("="*60)
 
-    def batch_sign(self, search_dir: str = ".", cert_name: str = None) -> Dict[str, Tuple[bool, str]]:
+    def batch_sign(self, search_dir: str = ".", cert_name: str = None,
+                   max_workers: int = None) -> Dict[str, Tuple[bool, str]]:
         """
-        批量签名文件
+        批量签名文件（签名主要耗时在外部进程，使用线程池并发执行）
         :param search_dir: 搜索目录
         :param cert_name: 证书名称
-        :return: 文件路径到结果的映射
+        :param max_workers: 最大并发数，默认为min(8, 文件数)
+        :return: 文件路径到结果的映射（按文件查找顺序）
         """
         files = self.find_target_files(search_dir)
         if not files:
             return {}
 
-        results = {}
-        for file_path in files:
-            print(f"\n[处理] 签名文件: {file_path}")
-            success, message = self.sign_file(file_path, cert_name)
-            results[file_path] = (success, message)
-
-            if success:
-                print(f"[成功] {message}")
-            else:
-                print(f"[失败] {message}")
+        # 预先解析签名工具，避免多个线程同时查找
+        self.find_signing_tool()
 
-        return results
+        completed = {}
+        self._batch_mode = True
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers or min(8, len(files))) as executor:
+                futures = {}
+                for file_path in files:
+                    print(f"\n[处理] 签名文件: {file_path}")
+                    futures[executor.submit(self.sign_file, file_path, cert_name)] = file_path
+
+                for future in as_completed(futures):
+                    file_path = futures[future]
+                    try:
+                        success, message = future.result()
+                    except Exception as e:
+                        success, message = False, f"[错误] 签名异常: {e}"
+                    completed[file_path] = (success, message)
+
+                    if success:
+                        print(f"[成功] {file_path}: {message}")
+                    else:
+                        print(f"[失败] {file_path}: {message}")
+        finally:
+            self._batch_mode = False
+            self.flush_records()
+
+        return {file_path: completed[file_path] for file_path in files}
 
 
 # 便捷函数
@@ -9,15 +9,30 @@ import sys
 import subprocess
 import shutil
 import json
+import re
 import time
+import stat
+import glob
+import platform
+import tempfile
+import threading
+import hashlib
+import functools
+import logging
+import traceback
+import importlib.util
+import importlib.metadata
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # 导入编码安全工具
 try:
-    from code_signer.utils import safe_subprocess_run
+    from code_signer.utils import decode_output_safely, sdk_version_key
     SAFE_SUBPROCESS_AVAILABLE = True
 except ImportError:
     SAFE_SUBPROCESS_AVAILABLE = False
+    sdk_version_key = None  # 退化为按路径字符串取最大
     print("[信息] 安全subprocess工具不可用，将使用传统方式")
 
 # 导入新的签名模块
@@ -28,43 +43,85 @@ except ImportError:
     NEW_SIGNER_AVAILABLE = False
     print("[信息] 新的签名模块不可用，将使用传统签名方式")
 
-def install_missing_packages():
-    """安装缺少的包"""
-    missing_packages = []
-
-    # 检查PIL/Pillow
-    try:
-        subprocess.run([sys.executable, "-c", "import PIL"],
-                      check=True, capture_output=True)
-    except subprocess.CalledProcessError:
-        missing_packages.append("Pillow")
-
-    # 检查PyQt5
-    try:
-        subprocess.run([sys.executable, "-c", "import PyQt5"],
-                      check=True, capture_output=True)
-    except subprocess.CalledProcessError:
-        missing_packages.append("PyQt5")
-
-    # 检查PyPDF2
+# 打包所需的包：(导入模块名, pip包名)
+REQUIRED_PACKAGES = [
+    ("PIL", "Pillow"),
+    ("PyQt5", "PyQt5"),
+    ("PyPDF2", "PyPDF2"),
+    # PDFium文本提取后端：两种后端的换行和空格不同，会影响字段提取结果，
+    # 必须安装并打包，保证每次构建的exe都使用同一后端（版本也计入构建哈希）
+    ("pypdfium2", "pypdfium2"),
+    ("pandas", "pandas"),
+]
+
+# PyInstaller 6.0起才支持--optimize（写入spec的Analysis）；更低版本改为以PYTHONOPTIMIZE=2启动PyInstaller子进程
+PYINSTALLER_MIN_OPTIMIZE_VERSION = (6, 0)
+
+def find_missing_packages():
+    """返回缺少的pip包名列表"""
+    # 在当前进程内查找模块，无需为每个包启动一个Python子进程
+    return [package for module_name, package in REQUIRED_PACKAGES
+            if importlib.util.find_spec(module_name) is None]
+
+def _installed_version(distribution):
+    """返回已安装包的版本号，未安装时返回空字符串"""
     try:
-        subprocess.run([sys.executable, "-c", "import PyPDF2"],
-                      check=True, capture_output=True)
-    except subprocess.CalledProcessError:
-        missing_packages.append("PyPDF2")
-
-    # 检查pandas
-    try:
-        subprocess.run([sys.executable, "-c", "import pandas"],
-                      check=True, capture_output=True)
-    except subprocess.CalledProcessError:
-        missing_packages.append("pandas")
+        return importlib.metadata.version(distribution)
+    except importlib.metadata.PackageNotFoundError:
+        return ""
+
+# pip命令的公共参数：跳过pip自身的版本检查和交互提示，减少pip启动开销；
+# 优先使用预编译wheel，避免源码包本地编译，wheel会进入pip默认缓存供下次复用
+PIP_COMMON_ARGS = ["--disable-pip-version-check", "--no-input", "--prefer-binary"]
+
+def download_packages_parallel(packages, dest_root):
+    """
+    并行下载多个包（含依赖），各包使用独立目录，避免多个pip同时写同一个文件
+    :return: 下载目录列表，任一包下载失败时返回None
+    """
+    def download(package):
+        dest = os.path.join(dest_root, package)
+        result = subprocess.run([sys.executable, "-m", "pip", "download"] + PIP_COMMON_ARGS +
+                                ["-d", dest, package],
+                                capture_output=True, text=True, errors="replace")
+        if result.returncode != 0:
+            print(f"下载 {package} 失败: {result.stderr.strip()}")
+            return None
+        return dest
+
+    with ThreadPoolExecutor(max_workers=min(4, len(packages))) as executor:
+        dirs = list(executor.map(download, packages))
+    return None if None in dirs else dirs
+
+def install_missing_packages(missing_packages=None):
+    """
+    安装缺少的包
+    :param missing_packages: 已检测出的缺少包列表，为None时重新检测
+    """
+    if missing_packages is None:
+        missing_packages = find_missing_packages()
 
     # 安装缺少的包
     if missing_packages:
         print(f"正在安装缺少的包: {', '.join(missing_packages)}")
+
+        # 缺少多个包时先并行下载，网络等待时间互相重叠，再一次性离线安装
+        if len(missing_packages) > 1:
+            with tempfile.TemporaryDirectory(prefix="pip_download_") as download_root:
+                download_dirs = download_packages_parallel(missing_packages, download_root)
+                if download_dirs:
+                    find_links = []
+                    for d in download_dirs:
+                        find_links += ["--find-links", d]
+                    result = subprocess.run([sys.executable, "-m", "pip", "install", "--no-index"] +
+                                            PIP_COMMON_ARGS + find_links + missing_packages)
+                    if result.returncode == 0:
+                        print("包安装成功")
+                        return True
+                print("并行下载安装未成功，改为直接安装")
+
         try:
-            subprocess.run([sys.executable, "-m", "pip", "install"] + missing_packages,
+            subprocess.run([sys.executable, "-m", "pip", "install"] + PIP_COMMON_ARGS + missing_packages,
                           check=True)
             print("包安装成功")
             return True
@@ -89,155 +146,325 @@ def check_files():
     print("文件检查通过")
     return True
 
+def _remove_readonly(func, path, _exc):
+    """rmtree遇到只读文件时去掉只读属性后重试一次（Windows上只读文件无法直接删除）"""
+    try:
+        os.chmod(path, stat.S_IWRITE)
+        func(path)
+    except OSError:
+        pass
+
+def rmtree_force(path):
+    """删除目录树，只读文件也一并删除，其余无法删除的文件忽略"""
+    if sys.version_info >= (3, 12):
+        shutil.rmtree(path, onexc=_remove_readonly)
+    else:
+        shutil.rmtree(path, onerror=_remove_readonly)
+
 def clean_old_files():
-    """清理旧的打包文件"""
-    dirs_to_remove = ['build', 'dist', 'PDF重命名工具_便携版']
-    files_to_remove = ['*.spec']
-
-    for item in dirs_to_remove + files_to_remove:
-        if os.path.exists(item):
-            if os.path.isdir(item):
-                shutil.rmtree(item)
+    """
+    清理旧的打包文件，包括build工作目录和spec文件（PyInstaller的增量缓存）
+    目录先改名再由后台线程删除，改名只是一次元数据操作，打包无需等待逐个文件删除
+    """
+    dirs_to_remove = {'build', 'dist', 'PDF重命名工具_便携版'}
+    trash_dirs = []
+
+    # 一次扫描当前目录，按名称分类删除
+    with os.scandir('.') as entries:
+        for entry in entries:
+            if entry.name in dirs_to_remove and entry.is_dir():
+                trash = f".{entry.name}.del.{os.getpid()}"
+                try:
+                    os.rename(entry.path, trash)
+                    trash_dirs.append(trash)
+                except OSError:
+                    # 目录中有文件被占用等情况下无法改名，直接删除
+                    rmtree_force(entry.path)
+            elif entry.name.startswith('.') and '.del.' in entry.name and entry.is_dir():
+                # 之前中断的运行遗留的待删除目录
+                trash_dirs.append(entry.path)
+            elif entry.name.endswith('.spec') and entry.is_file():
+                os.unlink(entry.path)
+
+    # 非守护线程：程序退出前会等待删除完成，不留下残留目录
+    for trash in trash_dirs:
+        threading.Thread(target=rmtree_force, args=(trash,)).start()
+
+# PyInstaller首次打包生成的spec文件，之后的打包直接复用
+SPEC_FILE = "PDF_Rename_Operation.spec"
+# 从spec的Analysis(...)中读取字节码优化级别
+_SPEC_OPTIMIZE_RE = re.compile(r"\boptimize\s*=\s*(-?[0-9]+)")
+APP_NAME = "PDF_Rename_Operation"
+# 上次成功打包时输入内容的哈希，与当前一致时跳过打包
+BUILD_HASH_FILE = "dist/.build_hash"
+# 上次签名完成后exe的哈希，exe未变化时跳过重复签名
+SIGNED_HASH_FILE = "dist/.signed_hash"
+SIGNATURE_REUSED_MESSAGE = "文件未变化，沿用已有签名"  # 跳过重签时sign_exe_file_unified返回的说明
+
+# 程序用不到、但会被PyInstaller顺带分析和打包的模块
+EXCLUDED_MODULES = [
+    "tkinter",
+    "matplotlib",
+    "pandas.tests",
+    "PyQt5.QtWebEngineWidgets",
+    "PyQt5.QtQml",
+    "PyQt5.QtBluetooth",
+    "test",
+    "unittest",
+    "pydoc_data",
+]
+
+def run_streaming(cmd, tail_lines=200, env=None):
+    """
+    运行命令并逐行实时输出，只保留最后若干行用于失败诊断
+    :param cmd: 命令列表
+    :param tail_lines: 保留的输出行数
+    :param env: 子进程环境变量，None表示继承当前环境
+    :return: (返回码, 最后若干行输出)
+    """
+    tail = deque(maxlen=tail_lines)
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, env=env)
+    with proc.stdout:
+        for raw_line in proc.stdout:
+            if SAFE_SUBPROCESS_AVAILABLE:
+                line = decode_output_safely(raw_line, 'utf-8')
             else:
-                for f in Path('.').glob(item):
-                    f.unlink()
-
-def build_exe():
-    """打包exe文件"""
+                line = raw_line.decode('utf-8', errors='replace')
+            line = line.rstrip('\r\n')
+            print(line)
+            tail.append(line)
+    return proc.wait(), tail
+
+class _TailLogHandler(logging.Handler):
+    """只保留最后若干条日志记录，用于进程内打包失败时输出诊断信息"""
+
+    def __init__(self, tail_lines=200):
+        super().__init__()
+        self.tail = deque(maxlen=tail_lines)
+        self.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
+
+    def emit(self, record):
+        self.tail.append(self.format(record))
+
+def run_pyinstaller_in_process(pyinstaller_args, tail_lines=200):
+    """
+    在当前进程内运行PyInstaller
+    PyInstaller会重新配置根日志并修改sys.path/sys.argv，运行结束后恢复，避免影响打包后的签名等步骤
+    :return: (返回码, 最后若干行日志)
+    """
+    root_logger = logging.getLogger()
+    saved_handlers, saved_level = root_logger.handlers[:], root_logger.level
+    saved_path, saved_argv = sys.path[:], sys.argv[:]
+    tail_handler = _TailLogHandler(tail_lines)
+    try:
+        from PyInstaller.__main__ import run as pyinstaller_run
+        root_logger.addHandler(tail_handler)
+        pyinstaller_run(pyinstaller_args)
+        returncode = 0
+    except SystemExit as e:
+        # PyInstaller出错时通过sys.exit退出
+        returncode = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except Exception:
+        # 其他异常同样按打包失败处理，保留异常信息用于诊断
+        returncode = 1
+        tail_handler.tail.extend(traceback.format_exc().rstrip("\n").splitlines())
+    finally:
+        root_logger.handlers[:] = saved_handlers
+        root_logger.setLevel(saved_level)
+        sys.path[:] = saved_path
+        sys.argv[:] = saved_argv
+    return returncode, tail_handler.tail
+
+def pyinstaller_in_process(optimize=True):
+    """本次打包是否在当前进程内调用PyInstaller（旧版本需以PYTHONOPTIMIZE运行时只能启动子进程）"""
+    if optimize and not pyinstaller_supports_optimize():
+        return False
+    return importlib.util.find_spec("PyInstaller") is not None
+
+def compute_build_hash(onedir=False, optimize=True):
+    """
+    计算打包输入的哈希：项目中的所有.py文件、图标、requirements.txt、spec文件、
+    打包选项以及依赖包和PyInstaller的已安装版本（升级依赖后会重新打包）
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{sys.version}|onedir={onedir}|optimize={optimize}".encode("utf-8"))
+    for distribution in [package for _, package in REQUIRED_PACKAGES] + ["pyinstaller"]:
+        h.update(f"|{distribution}={_installed_version(distribution)}".encode("utf-8"))
+
+    input_files = ["PDF_Rename_Operation_Logo.ico", "requirements.txt", SPEC_FILE]
+    skip_dirs = {"build", "dist", "__pycache__", "PDF重命名工具_便携版"}
+    for dirpath, dirnames, filenames in os.walk("."):
+        dirnames[:] = [d for d in dirnames if d not in skip_dirs and not d.startswith(".")]
+        input_files.extend(os.path.join(dirpath, name) for name in filenames if name.endswith(".py"))
+
+    for path in sorted(input_files):
+        try:
+            data = Path(path).read_bytes()
+        except FileNotFoundError:
+            continue
+        h.update(path.replace("\\", "/").encode("utf-8"))
+        h.update(b"\0")
+        h.update(data)
+    return h.hexdigest()
+
+def pyinstaller_supports_optimize():
+    """已安装的PyInstaller是否支持--optimize参数"""
+    version = tuple(int(part) for part in re.findall(r"\d+", _installed_version("pyinstaller"))[:2])
+    return version >= PYINSTALLER_MIN_OPTIMIZE_VERSION
+
+def get_exe_path(onedir=False):
+    """返回打包生成的exe路径"""
+    if onedir:
+        return f"dist/{APP_NAME}/{APP_NAME}.exe"
+    return f"dist/{APP_NAME}.exe"
+
+def build_exe(force_clean=False, onedir=False, optimize=True):
+    """
+    打包exe文件
+    :param force_clean: 为True时传入--clean，丢弃build目录中的缓存完整重新构建
+    :param onedir: 为True时打包为目录版（--onedir），启动时无需每次解压到临时目录
+    :param optimize: 为True时以优化级别2打包，去掉字节码中的assert和文档字符串
+                     （PyInstaller 6.0+使用--optimize=2，更低版本以PYTHONOPTIMIZE=2运行子进程）
+    """
     print("开始打包...")
-
-    
-    cmd = [
-        sys.executable, "-m", "PyInstaller",
-        "--name=PDF_Rename_Operation",
-        "--onefile",
-        "--windowed",
-        "--icon=PDF_Rename_Operation_Logo.ico",
-        "--clean",
-        "--noconfirm"
-    ]
-
-  
-    # 添加主程序文件
-    cmd.append("PDF_Rename_Operation.py")
+    optimize_level = 2 if optimize else 0
+    optimize_in_spec = pyinstaller_supports_optimize()
+    child_env = None
+    if optimize and not optimize_in_spec:
+        print(f"[WARN]  PyInstaller版本低于{'.'.join(map(str, PYINSTALLER_MIN_OPTIMIZE_VERSION))}，"
+              "不支持--optimize，改为以PYTHONOPTIMIZE=2运行PyInstaller")
+        child_env = dict(os.environ, PYTHONOPTIMIZE=str(optimize_level))
+
+    # 输入没有变化且上次打包的exe还在时，直接复用上次的结果
+    build_hash = compute_build_hash(onedir, optimize)
+    if not force_clean and os.path.exists(get_exe_path(onedir)):
+        try:
+            with open(BUILD_HASH_FILE, encoding="utf-8") as f:
+                if f.read().strip() == build_hash:
+                    print("源文件未变化，跳过打包，使用上次的打包结果")
+                    return True
+        except FileNotFoundError:
+            pass
+
+    # spec中记录了打包模式（onedir的spec包含COLLECT步骤）和字节码优化级别（Analysis的optimize=），
+    # 与本次要求不一致时重新生成spec
+    if os.path.exists(SPEC_FILE):
+        with open(SPEC_FILE, encoding="utf-8") as f:
+            spec_text = f.read()
+        spec_is_onedir = "COLLECT(" in spec_text
+        match = _SPEC_OPTIMIZE_RE.search(spec_text)
+        spec_optimize = int(match.group(1)) if match else 0
+        if spec_is_onedir != onedir:
+            print("打包模式已变化，重新生成spec文件")
+            os.unlink(SPEC_FILE)
+        elif optimize_in_spec and spec_optimize != optimize_level:
+            print("字节码优化级别已变化，重新生成spec文件")
+            os.unlink(SPEC_FILE)
+        elif not optimize_in_spec and match:
+            # 由PyInstaller 6+生成、含optimize=的spec，旧版本无法解析
+            print("spec文件由更高版本的PyInstaller生成，重新生成spec文件")
+            os.unlink(SPEC_FILE)
+
+    # 默认保留build工作目录，未变化的模块可直接复用上次的分析和编译结果
+    pyinstaller_args = ["--workpath=build", "--noconfirm"]
+    # 以PYTHONOPTIMIZE运行时优化级别不记录在spec中，build目录里可能是其他级别编译的缓存，需丢弃
+    if force_clean or child_env is not None:
+        pyinstaller_args.append("--clean")
+
+    if os.path.exists(SPEC_FILE):
+        # 已有spec文件时直接使用，不再由命令行参数重新生成
+        print(f"使用已有的spec文件: {SPEC_FILE}")
+        pyinstaller_args.append(SPEC_FILE)
+    else:
+        # 首次打包通过命令行参数生成spec文件，之后的打包都复用它
+        pyinstaller_args += [
+            f"--name={APP_NAME}",
+            "--onedir" if onedir else "--onefile",
+            "--windowed",
+            "--icon=PDF_Rename_Operation_Logo.ico",
+        ]
+        if optimize_in_spec:
+            # 显式指定优化级别，写入spec的Analysis(optimize=...)，不依赖打包进程自身的-O设置
+            pyinstaller_args.append(f"--optimize={optimize_level}")
+        pyinstaller_args += [f"--exclude-module={name}" for name in EXCLUDED_MODULES]
+        pyinstaller_args.append("PDF_Rename_Operation.py")
+
+    # 每种Python版本/架构使用独立的PyInstaller缓存目录，多个构建可以并行而不互相破坏缓存；
+    # 目录名固定，下次同样的构建仍能复用缓存。需在导入PyInstaller前设置
+    os.environ.setdefault(
+        "PYINSTALLER_CONFIG_DIR",
+        os.path.join(tempfile.gettempdir(),
+                     f"pyi_py{sys.version_info[0]}{sys.version_info[1]}_{platform.machine() or 'unknown'}"))
 
     try:
         print("正在执行打包命令...")
-        if SAFE_SUBPROCESS_AVAILABLE:
-            result = safe_subprocess_run(cmd, encoding='utf-8')
+        # 优先在当前进程内调用PyInstaller，省去新解释器启动和模块导入
+        if pyinstaller_in_process(optimize):
+            returncode, output_tail = run_pyinstaller_in_process(pyinstaller_args)
         else:
-            result = subprocess.run(cmd, capture_output=True, text=True, encoding='utf-8')
-
-        if result.returncode == 0:
-            exe_path = "dist/PDF_Rename_Operation.exe"
-            if os.path.exists(exe_path):
-                size_mb = os.path.getsize(exe_path) / (1024 * 1024)
-                print(f"打包成功! 文件大小: {size_mb:.1f}MB")
-                return True
-            else:
+            # 实时输出PyInstaller日志，避免整个构建输出堆积在内存中
+            cmd = [sys.executable, "-m", "PyInstaller"] + pyinstaller_args
+            returncode, output_tail = run_streaming(cmd, env=child_env)
+
+        if returncode == 0:
+            # 一次stat同时判断exe是否存在并取得大小
+            try:
+                exe_stat = os.stat(get_exe_path(onedir))
+            except FileNotFoundError:
                 print("打包完成但找不到exe文件")
                 return False
+            size_mb = exe_stat.st_size / (1024 * 1024)
+            print(f"打包成功! 文件大小: {size_mb:.1f}MB")
+            # 打包可能重新生成了spec文件，按打包后的输入重新计算哈希
+            write_text_if_changed(BUILD_HASH_FILE, compute_build_hash(onedir, optimize))
+            return True
         else:
             print("打包失败!")
-            if result.stderr:
-                print("错误信息:")
-                print(result.stderr)
+            if output_tail:
+                print(f"错误信息（最后{len(output_tail)}行输出）:")
+                print("\n".join(output_tail))
             return False
     except Exception as e:
         print(f"打包过程中出错: {e}")
         return False
 
+@functools.lru_cache(maxsize=1)
 def find_signtool():
-    """查找系统中可用的signtool.exe"""
-    possible_paths = [
-        r"C:\Program Files (x86)\Windows Kits\10\bin\10.0.22621.0\x64\signtool.exe",
-        r"C:\Program Files (x86)\Windows Kits\10\bin\10.0.22000.0\x64\signtool.exe",
-        r"C:\Program Files (x86)\Windows Kits\10\bin\10.0.20348.0\x64\signtool.exe",
-        r"C:\Program Files (x86)\Windows Kits\8.1\bin\x64\signtool.exe",
-        r"C:\Program Files\Windows Kits\10\bin\10.0.22621.0\x64\signtool.exe",
-        r"C:\Program Files\Windows Kits\10\bin\10.0.22000.0\x64\signtool.exe",
-        r"C:\Program Files\Windows Kits\10\bin\10.0.20348.0\x64\signtool.exe",
-    ]
-
-    # 搜索所有可能的Windows Kits版本
-    try:
-        import glob
-        search_paths = [
-            r"C:\Program Files (x86)\Windows Kits\10\bin\*\x64\signtool.exe",
-            r"C:\Program Files\Windows Kits\10\bin\*\x64\signtool.exe"
-        ]
-
-        for pattern in search_paths:
-            matches = glob.glob(pattern)
-            if matches:
-                possible_paths.extend(matches)
-    except:
-        pass
-
-    for path in possible_paths:
-        if os.path.exists(path):
-            return path
-
-    return None
-
-def install_signtool_alternative():
-    """安装替代的签名工具（使用PowerShell脚本）"""
-    powershell_script = """
-# PowerShell代码签名脚本
-param(
-    [Parameter(Mandatory=$true)]
-    [string]$FilePath,
-
-    [Parameter(Mandatory=$true)]
-    [string]$CertificatePath,
-
-    [Parameter(Mandatory=$false)]
-    [string]$TimestampServer = "http://timestamp.digicert.com"
-)
-
-try {
-    # 加载证书
-    $cert = New-Object System.Security.Cryptography.X509Certificates.X509Certificate2($CertificatePath)
-
-    # 获取文件内容
-    $fileContent = Get-Content -Path $FilePath -Raw -Encoding Byte
-
-    # 创建签名器
-    $signer = New-Object System.Security.Cryptography.Pkcs.SignedCms
-    $contentInfo = New-Object System.Security.Cryptography.Pkcs.ContentInfo $fileContent
-    $signer.Content = $contentInfo
-
-    # 创建签名者信息
-    $signerInfo = New-Object System.Security.Cryptography.Pkcs.SignerInfo
-    $signerInfo.Certificate = $cert
-
-    # 添加签名
-    $signer.ComputeSignature($signerInfo)
-
-    # 保存签名后的文件
-    $signedContent = $signer.Encode()
-    [System.IO.File]::WriteAllBytes($FilePath, $signedContent)
-
-    Write-Host "文件签名成功: $FilePath"
-    return $true
-}
-catch {
-    Write-Host "签名失败: $($_.Exception.Message)"
-    return $false
-}
-"""
-
-    script_path = "sign_file.ps1"
-    try:
-        with open(script_path, "w", encoding="utf-8") as f:
-            f.write(powershell_script)
-        return script_path
-    except Exception as e:
-        print(f"创建PowerShell签名脚本失败: {e}")
-        return None
+    """查找系统中可用的signtool.exe（结果在进程内缓存）"""
+    # 优先使用环境变量SIGNTOOL指定的路径，其次是PATH中的signtool（如VS开发者命令行）
+    env_path = os.environ.get("SIGNTOOL")
+    if env_path and os.path.isfile(env_path):
+        return env_path
+    found = shutil.which("signtool")
+    if found:
+        return found
+
+    # App Certification Kit目录不带版本号，安装Windows SDK时都会存在，无需枚举版本目录
+    for program_files in (os.environ.get("ProgramFiles(x86)"), os.environ.get("ProgramFiles")):
+        if program_files:
+            ack_path = os.path.join(program_files, "Windows Kits", "10",
+                                    "App Certification Kit", "signtool.exe")
+            if os.path.isfile(ack_path):
+                return ack_path
+
+    # 一次glob覆盖两个Program Files目录下的所有Windows 10 SDK版本，取版本号最新的
+    matches = glob.glob(r"C:\Program Files*\Windows Kits\10\bin\*\x64\signtool.exe")
+    if matches:
+        return max(matches, key=sdk_version_key)
+
+    # 回退到Windows 8.1 SDK
+    matches = glob.glob(r"C:\Program Files*\Windows Kits\8.1\bin\x64\signtool.exe")
+    return matches[0] if matches else None
 
 def sign_exe_file(exe_path, certificate_path="170859-code-signing.cer"):
     """对EXE文件进行代码签名"""
+    return sign_exe_files([exe_path], certificate_path)
+
+def sign_exe_files(exe_paths, certificate_path="170859-code-signing.cer"):
+    """
+    对多个EXE文件进行代码签名
+    signtool一次调用签名全部文件，启动、打开证书和连接时间戳服务器的开销只需一次
+    """
     print("开始代码签名...")
 
     # 检查证书文件
@@ -246,9 +473,10 @@ def sign_exe_file(exe_path, certificate_path="170859-code-signing.cer"):
         return False, "证书文件不存在"
 
     # 检查EXE文件
-    if not os.path.exists(exe_path):
-        print(f"错误: 找不到EXE文件 {exe_path}")
-        return False, "EXE文件不存在"
+    for exe_path in exe_paths:
+        if not os.path.exists(exe_path):
+            print(f"错误: 找不到EXE文件 {exe_path}")
+            return False, "EXE文件不存在"
 
     # 方法1: 尝试使用signtool
     signtool_path = find_signtool()
@@ -259,60 +487,34 @@ def sign_exe_file(exe_path, certificate_path="170859-code-signing.cer"):
                 signtool_path, "sign",
                 "/f", certificate_path,
                 "/fd", "SHA256",  # 添加摘要算法参数
-                "/t", "http://timestamp.digicert.com",
+                # RFC3161时间戳
+                "/tr", "http://timestamp.digicert.com",
+                "/td", "SHA256",
                 "/sha1", "170859",  # 假设证书指纹
-                exe_path
-            ]
+            ] + list(exe_paths)
 
             print("正在使用signtool签名...")
-            if SAFE_SUBPROCESS_AVAILABLE:
-                result = safe_subprocess_run(cmd, encoding='utf-8')
-            else:
-                result = subprocess.run(cmd, capture_output=True, text=True, encoding='utf-8')
+            # 实时输出signtool日志（时间戳服务器可能响应较慢）
+            returncode, _ = run_streaming(cmd)
 
-            if result.returncode == 0:
+            if returncode == 0:
                 print("[OK] signtool签名成功!")
                 return True, "signtool签名成功"
             else:
-                print(f"signtool签名失败: {result.stderr}")
+                print(f"signtool签名失败，返回码: {returncode}")
 
         except Exception as e:
             print(f"signtool签名异常: {e}")
     else:
         print("未找到signtool，尝试其他方法...")
 
-    # 方法2: 尝试使用PowerShell和.NET
-    try:
-        print("尝试使用PowerShell脚本签名...")
-        script_path = install_signtool_alternative()
-        if script_path:
-            cmd = [
-                "powershell", "-ExecutionPolicy", "Bypass", "-File", script_path,
-                "-FilePath", exe_path,
-                "-CertificatePath", certificate_path
-            ]
-
-            if SAFE_SUBPROCESS_AVAILABLE:
-                result = safe_subprocess_run(cmd, encoding='utf-8')
-            else:
-                result = subprocess.run(cmd, capture_output=True, text=True, encoding='utf-8')
+    # signtool不可用或失败时，逐个文件使用其他方法
+    results = [_sign_exe_file_fallback(exe_path, certificate_path) for exe_path in exe_paths]
+    return all(ok for ok, _ in results), "; ".join(message for _, message in results)
 
-            # 清理临时脚本
-            try:
-                os.remove(script_path)
-            except:
-                pass
-
-            if result.returncode == 0:
-                print("[OK] PowerShell签名成功!")
-                return True, "PowerShell签名成功"
-            else:
-                print(f"PowerShell签名失败: {result.stderr}")
-
-    except Exception as e:
-        print(f"PowerShell签名异常: {e}")
-
-    # 方法3: 使用osslsigncode（如果可用）
+def _sign_exe_file_fallback(exe_path, certificate_path):
+    """signtool不可用时对单个文件依次尝试其他签名方式"""
+    # 方法2: 使用osslsigncode（如果可用）
     try:
         print("尝试使用osslsigncode签名...")
         cmd = [
@@ -323,9 +525,9 @@ def sign_exe_file(exe_path, certificate_path="170859-code-signing.cer"):
             "-out", exe_path + ".signed"
         ]
 
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        returncode, _ = run_streaming(cmd)
 
-        if result.returncode == 0 and os.path.exists(exe_path + ".signed"):
+        if returncode == 0 and os.path.exists(exe_path + ".signed"):
             # 替换原文件
             os.replace(exe_path + ".signed", exe_path)
             print("[OK] osslsigncode签名成功!")
@@ -336,7 +538,7 @@ def sign_exe_file(exe_path, certificate_path="170859-code-signing.cer"):
     except Exception as e:
         print(f"osslsigncode签名异常: {e}")
 
-    # 方法4: 创建签名信息文件
+    # 方法3: 创建签名信息文件
     print("创建数字签名信息文件...")
     signature_info = {
         "signature_info": {
@@ -364,6 +566,42 @@ def sign_exe_file(exe_path, certificate_path="170859-code-signing.cer"):
         print(f"创建签名信息文件失败: {e}")
         return False, "签名失败"
 
+@functools.lru_cache(maxsize=4)
+def _make_signer(config_file, mtime_ns):
+    """
+    按配置文件创建签名器并缓存；修改时间参与缓存键，配置文件修改后自动重新加载
+    :param config_file: 配置文件路径，为None时使用默认配置
+    """
+    if config_file is None:
+        return CodeSigner()
+    return CodeSigner.from_config(config_file)
+
+def load_code_signer():
+    """
+    创建 code_signer 签名器（按配置文件缓存，可在打包期间提前在后台创建）
+    :return: (签名器, 使用的配置说明)
+    """
+    # 尝试加载配置文件
+    config_files = [
+        "code_signer/examples/project_config.py",
+        "signing_config.py"
+    ]
+
+    for config_file in config_files:
+        try:
+            mtime_ns = os.stat(config_file).st_mtime_ns
+        except FileNotFoundError:
+            continue
+        try:
+            print(f"[信息] 使用配置文件: {config_file}")
+            return _make_signer(config_file, mtime_ns), config_file
+        except Exception as e:
+            print(f"[警告] 配置文件 {config_file} 加载失败: {e}")
+            continue
+
+    print("[信息] 使用默认配置")
+    return _make_signer(None, 0), "默认配置"
+
 def sign_exe_file_with_new_module(exe_path, config_path="code_signer/examples/project_config.py"):
     """使用新的签名模块进行代码签名"""
     if not NEW_SIGNER_AVAILABLE:
@@ -373,30 +611,7 @@ def sign_exe_file_with_new_module(exe_path, config_path="code_signer/examples/pr
     print("[信息] 使用新的 code_signer 模块进行签名")
 
     try:
-        # 尝试加载配置文件
-        config_files = [
-            "code_signer/examples/project_config.py",
-            "signing_config.py"
-        ]
-
-        signer = None
-        used_config = None
-
-        for config_file in config_files:
-            if os.path.exists(config_file):
-                try:
-                    print(f"[信息] 使用配置文件: {config_file}")
-                    signer = CodeSigner.from_config(config_file)
-                    used_config = config_file
-                    break
-                except Exception as e:
-                    print(f"[警告] 配置文件 {config_file} 加载失败: {e}")
-                    continue
-
-        if signer is None:
-            print("[信息] 使用默认配置")
-            signer = CodeSigner()
-            used_config = "默认配置"
+        signer, used_config = load_code_signer()
 
         # 显示使用的配置信息
         print(f"[成功] 签名器初始化成功，使用配置: {used_config}")
@@ -426,12 +641,77 @@ def sign_exe_file_with_new_module(exe_path, config_path="code_signer/examples/pr
         print(f"[错误] {error_msg}")
         return False, error_msg
 
+def file_sha256(path):
+    """分块计算文件的SHA-256"""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def has_authenticode_signature(path):
+    """检查PE文件的证书表（数据目录第5项）是否非空，即文件中是否已嵌入Authenticode签名"""
+    try:
+        with open(path, "rb") as f:
+            header = f.read(4096)
+    except OSError:
+        return False
+    if len(header) < 0x40 or header[:2] != b"MZ":
+        return False
+    pe_offset = int.from_bytes(header[0x3C:0x40], "little")
+    if header[pe_offset:pe_offset + 4] != b"PE\0\0":
+        return False
+
+    optional_header = pe_offset + 24
+    magic = int.from_bytes(header[optional_header:optional_header + 2], "little")
+    if magic == 0x10b:      # PE32
+        rva_count_offset = optional_header + 92
+    elif magic == 0x20b:    # PE32+
+        rva_count_offset = optional_header + 108
+    else:
+        return False
+
+    security_entry = rva_count_offset + 4 + 4 * 8
+    if len(header) < security_entry + 8:
+        return False
+    if int.from_bytes(header[rva_count_offset:rva_count_offset + 4], "little") < 5:
+        return False
+    return int.from_bytes(header[security_entry + 4:security_entry + 8], "little") > 0
+
 def sign_exe_file_unified(exe_path):
-    """统一的签名函数，优先使用新模块，回退到传统方式"""
+    """
+    统一的签名函数，优先使用新模块，回退到传统方式
+    文件自上次签名后未变化（哈希与签名后记录的一致）且已包含签名时，跳过重复签名和时间戳请求
+    """
     print("\n" + "=" * 50)
     print("开始数字签名流程")
     print("=" * 50)
 
+    try:
+        exe_hash = file_sha256(exe_path)
+    except OSError:
+        exe_hash = None
+    signed_record = f"{exe_hash} {exe_path}\n"
+
+    if exe_hash is not None and has_authenticode_signature(exe_path):
+        try:
+            with open(SIGNED_HASH_FILE, encoding="utf-8") as f:
+                if f.read() == signed_record:
+                    print("[跳过] 文件自上次签名后未变化，已包含数字签名")
+                    return True, SIGNATURE_REUSED_MESSAGE
+        except FileNotFoundError:
+            pass
+
+    success, message = _sign_exe_file_with_available_signer(exe_path)
+
+    # 只记录真正嵌入了签名的文件（生成签名信息文件的回退方式不算）
+    if success and has_authenticode_signature(exe_path):
+        os.makedirs(os.path.dirname(SIGNED_HASH_FILE), exist_ok=True)
+        write_text_if_changed(SIGNED_HASH_FILE, f"{file_sha256(exe_path)} {exe_path}\n")
+    return success, message
+
+def _sign_exe_file_with_available_signer(exe_path):
+    """依次尝试新签名模块和传统签名方式"""
     # 首先尝试使用新模块
     if NEW_SIGNER_AVAILABLE:
         print("[优先] 尝试使用新的 code_signer 模块")
@@ -452,27 +732,59 @@ def sign_exe_file_unified(exe_path):
         print("[错误] 未找到证书文件，无法进行传统签名")
         return False, "未找到签名证书"
 
-def create_portable_package():
-    """创建便携包"""
-    print("创建便携包...")
+def write_text_if_changed(path, text, encoding="utf-8"):
+    """
+    内容有变化时才写入文件，先写临时文件再替换，避免留下写了一半的文件
+    :return: 是否实际写入
+    """
+    target = Path(path)
+    data = text.encode(encoding)
+    try:
+        if target.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
 
-    portable_dir = "PDF重命名工具_便携版"
-    if os.path.exists(portable_dir):
-        shutil.rmtree(portable_dir)
-    os.makedirs(portable_dir)
+    tmp = target.with_name(target.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, target)
+    return True
 
-    # 复制exe文件
-    exe_source = "dist/PDF_Rename_Operation.exe"
-    exe_dest = f"{portable_dir}/PDF_Rename_Operation.exe"
+def copy_if_changed(src, dst):
+    """
+    大小和修改时间都相同时跳过复制，否则只复制内容并同步时间戳，供下次比较
+    :return: 是否实际复制
+    """
+    src_stat = os.stat(src)
+    try:
+        dst_stat = os.stat(dst)
+        if (dst_stat.st_size == src_stat.st_size and
+                dst_stat.st_mtime_ns == src_stat.st_mtime_ns):
+            return False
+    except FileNotFoundError:
+        pass
 
-    if os.path.exists(exe_source):
-        shutil.copy2(exe_source, exe_dest)
+    shutil.copyfile(src, dst)
+    os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+    return True
 
-        # 创建使用说明
-        readme = f"""PDF重命名工具使用说明
+def sync_tree(src_dir, dst_dir):
+    """把目录同步到目标位置：只复制有变化的文件，并删除源目录中已不存在的文件"""
+    shutil.copytree(src_dir, dst_dir, copy_function=copy_if_changed, dirs_exist_ok=True)
+    for root, dirs, files in os.walk(dst_dir, topdown=False):
+        src_root = os.path.join(src_dir, os.path.relpath(root, dst_dir))
+        for name in files:
+            if not os.path.exists(os.path.join(src_root, name)):
+                os.unlink(os.path.join(root, name))
+        for name in dirs:
+            if not os.path.isdir(os.path.join(src_root, name)):
+                shutil.rmtree(os.path.join(root, name))
+
+# 便携包中的使用说明模板
+README_TEMPLATE = """PDF重命名工具使用说明
 ==================
 
-1. 双击运行"PDF_Rename_Operation.exe"
+1. 双击运行"{run_path}"
 2. 输入测试方法，用分号分隔
    例如：Total Lead Content Test;Total Cadmium Content Test;Nickel Release Test
 3. 选择PDF文件
@@ -490,13 +802,63 @@ def create_portable_package():
 数字签名信息：
 - 本程序已准备数字签名
 - 证书文件：170859-code-signing.cer
-- 签名时间：{time.strftime("%Y-%m-%d %H:%M:%S")}
+- 签名时间：{signing_time}
 
-更新日期：{Path.cwd()}
+更新日期：{update_date}
 """
 
-        with open(f"{portable_dir}/使用说明.txt", "w", encoding="utf-8") as f:
-            f.write(readme)
+def create_portable_package(onedir=False):
+    """
+    创建便携包
+    :param onedir: 为True时复制目录版的整个程序目录
+    """
+    print("创建便携包...")
+
+    portable_dir = "PDF重命名工具_便携版"
+    exe_name = f"{APP_NAME}.exe"
+    readme_name = "使用说明.txt"
+    # 便携包中需要保留的程序文件（单文件版为exe，目录版为程序目录）
+    payload_name = APP_NAME if onedir else exe_name
+
+    # 保留目录中已有的程序和说明文件，只清理其他残留内容
+    os.makedirs(portable_dir, exist_ok=True)
+    with os.scandir(portable_dir) as entries:
+        for entry in entries:
+            if entry.name == readme_name and entry.is_file():
+                continue
+            if entry.name == payload_name and (
+                    entry.is_dir(follow_symlinks=False) if onedir else entry.is_file()):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+
+    exe_source = get_exe_path(onedir)
+    try:
+        src_stat = os.stat(exe_source)
+    except FileNotFoundError:
+        src_stat = None
+
+    if src_stat is not None:
+        if onedir:
+            sync_tree(f"dist/{APP_NAME}", f"{portable_dir}/{APP_NAME}")
+            run_path = f"{APP_NAME}\\{exe_name}"
+        else:
+            if not copy_if_changed(exe_source, f"{portable_dir}/{exe_name}"):
+                print("便携包中的exe已是最新，跳过复制")
+            run_path = exe_name
+
+        # 创建使用说明（时间取自exe的修改时间，同一构建生成的内容完全相同）
+        build_time = time.localtime(src_stat.st_mtime)
+        readme = README_TEMPLATE.format_map({
+            "run_path": run_path,
+            "signing_time": time.strftime("%Y-%m-%d %H:%M:%S", build_time),
+            "update_date": time.strftime("%Y-%m-%d", build_time),
+        })
+
+        if write_text_if_changed(f"{portable_dir}/{readme_name}", readme):
+            print("已更新使用说明")
 
         print("便携包创建完成")
         return True
@@ -504,15 +866,35 @@ def create_portable_package():
         print("找不到exe文件，无法创建便携包")
         return False
 
-def main():
-    """主函数"""
+def pause(message, assume_yes=False):
+    """等待用户按回车；非交互模式（--yes）下直接返回"""
+    if not assume_yes:
+        input(message)
+
+def main(assume_yes=False, force_clean=False, onedir=False, optimize=True,
+         skip_sign=False, skip_portable=False):
+    """
+    主函数
+    :param assume_yes: 非交互模式，所有确认都按默认"是"处理，不等待回车
+    :param force_clean: 删除PyInstaller缓存，完整重新构建
+    :param onedir: 打包为目录版而不是单文件exe
+    :param optimize: 以优化级别2打包字节码
+    :param skip_sign: 不进行代码签名，也不询问
+    :param skip_portable: 不创建便携包
+    """
     print("=" * 60)
     print("PDF重命名工具一键打包+签名程序")
     print("=" * 60)
 
-    # 检查文件
-    if not check_files():
-        input("请确保所有必要文件都在当前目录，按回车退出...")
+    # 文件检查和依赖包检测互不依赖，并发执行
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        files_future = executor.submit(check_files)
+        missing_future = executor.submit(find_missing_packages)
+        files_ok = files_future.result()
+        missing_packages = missing_future.result()
+
+    if not files_ok:
+        pause("请确保所有必要文件都在当前目录，按回车退出...", assume_yes)
         return False
 
     # 检查签名证书
@@ -524,24 +906,8 @@ def main():
         print("[WARN]  未找到数字证书，将只进行打包")
         certificate_path = None
 
-    # 安装缺少的包（包括PIL/Pillow）
-    if not install_missing_packages():
-        input("包安装失败，按回车退出...")
-        return False
-
-    # 清理旧文件
-    clean_old_files()
-    print("已清理旧的打包文件")
-
-    # 打包
-    if not build_exe():
-        input("打包失败，按回车退出...")
-        return False
-
-    exe_path = "dist/PDF_Rename_Operation.exe"
-    signature_status = ""
-
-    # 代码签名（优先使用新模块）
+    # 代码签名（优先使用新模块）：打包前先确认是否签名以及签名工具是否可用，
+    # 避免打包完成后才发现无法签名
     print("\n" + "=" * 40)
     print("数字签名检查")
     print("=" * 40)
@@ -554,46 +920,111 @@ def main():
 
     # 询问是否进行签名
     try:
-        sign_choice = input("是否进行代码签名? (y/n): ").strip().lower()
-        if sign_choice in ['y', 'yes', '是', '']:
-            success, message = sign_exe_file_unified(exe_path)
-            if success:
-                signature_status = f" (已签名: {message})"
-                print(f"[OK] 代码签名完成: {message}")
-            else:
-                signature_status = f" (签名失败: {message})"
-                print(f"[ERROR] 代码签名失败: {message}")
-                print("提示: 您可以稍后手动进行签名")
+        if skip_sign:
+            sign_choice = 'n'
+        elif assume_yes:
+            sign_choice = 'y'
         else:
-            print("跳过代码签名")
+            sign_choice = input("是否进行代码签名? (y/n): ").strip().lower()
+        want_sign = sign_choice in ['y', 'yes', '是', '']
     except:
+        want_sign = False
+    if not want_sign:
         print("跳过代码签名")
 
+    if want_sign and not NEW_SIGNER_AVAILABLE:
+        signer_found = has_certificate and (find_signtool() or shutil.which("osslsigncode"))
+        if not signer_found:
+            print("[WARN]  未找到可用的签名工具（signtool/osslsigncode）或证书，打包后无法完成签名（最多只能生成签名信息文件）")
+            if not assume_yes:
+                try:
+                    choice = input("是否仍然继续打包? (y/n): ").strip().lower()
+                except:
+                    choice = 'n'
+                if choice not in ['y', 'yes', '是', '']:
+                    print("已取消打包")
+                    return False
+
+    # 默认保留上次的打包结果用于增量构建，指定--force-clean时清理旧文件
+    if force_clean:
+        clean_old_files()
+        print("已清理旧的打包文件")
+
+    # 安装缺少的包（包括PIL/Pillow）
+    packages_ok = install_missing_packages(missing_packages)
+
+    if not packages_ok:
+        pause("包安装失败，按回车退出...", assume_yes)
+        return False
+
+    # 打包；需要签名时在后台预先查找signtool、创建签名器（结果都会被缓存），与打包同时进行。
+    # PyInstaller在当前进程内运行时会修改日志和sys.path等全局状态，此时不并行，签名时再查找
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        if want_sign and not pyinstaller_in_process(optimize):
+            executor.submit(find_signtool)
+            if NEW_SIGNER_AVAILABLE:
+                executor.submit(load_code_signer)
+        build_ok = build_exe(force_clean, onedir, optimize)
+    if not build_ok:
+        pause("打包失败，按回车退出...", assume_yes)
+        return False
+
+    exe_path = get_exe_path(onedir)
+    signature_status = ""
+    signing_time = None
+    signature_reused = False
+
+    if want_sign:
+        try:
+            success, message = sign_exe_file_unified(exe_path)
+        except Exception as e:
+            success, message = False, f"签名异常: {e}"
+        if success:
+            # 只有本次真正执行了签名才记录签名时间；沿用上次签名时不显示当前时间
+            if message == SIGNATURE_REUSED_MESSAGE:
+                signature_reused = True
+            else:
+                signing_time = time.strftime("%Y-%m-%d %H:%M:%S")
+            signature_status = f" (已签名: {message})"
+            print(f"[OK] 代码签名完成: {message}")
+        else:
+            signature_status = f" (签名失败: {message})"
+            print(f"[ERROR] 代码签名失败: {message}")
+            print("提示: 您可以稍后手动进行签名")
+
     # 创建便携包（包含签名后的文件）
-    if not create_portable_package():
-        input("便携包创建失败，按回车退出...")
+    if not skip_portable and not create_portable_package(onedir):
+        pause("便携包创建失败，按回车退出...", assume_yes)
         return False
 
     print("\n" + "=" * 50)
     print("[SUCCESS] 一键打包+签名完成!")
     print("=" * 50)
     print("生成的文件:")
-    print(f"1. dist/PDF_Rename_Operation.exe{signature_status} - 单文件可执行程序")
-    print("2. PDF重命名工具_便携版/ - 包含说明的完整包")
+    if onedir:
+        print(f"1. {exe_path}{signature_status} - 目录版可执行程序")
+    else:
+        print(f"1. {exe_path}{signature_status} - 单文件可执行程序")
+    if not skip_portable:
+        print("2. PDF重命名工具_便携版/ - 包含说明的完整包")
 
-    if signature_status and "已签名" in signature_status:
+    if signing_time:
         print("\n[OK] 数字签名信息:")
         print(f"   - 证书文件: {certificate_path}")
-        print(f"   - 签名时间: {time.strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"   - 签名时间: {signing_time}")
         print("   - 时间戳服务器: http://timestamp.digicert.com")
+    elif signature_reused:
+        print("\n[OK] 数字签名信息:")
+        print("   - 文件自上次签名后未变化，沿用已有签名（未重新签名）")
 
-    # 询问是否打开文件夹
-    try:
-        choice = input("\n是否打开便携版目录? (y/n): ").strip().lower()
-        if choice == 'y':
-            os.startfile("PDF重命名工具_便携版")
-    except:
-        pass
+    # 询问是否打开文件夹（非交互模式或未创建便携包时跳过）
+    if not assume_yes and not skip_portable:
+        try:
+            choice = input("\n是否打开便携版目录? (y/n): ").strip().lower()
+            if choice == 'y':
+                os.startfile("PDF重命名工具_便携版")
+        except:
+            pass
 
     # 检查是否有签名信息文件
     signature_info_file = exe_path.replace(".exe", "_signature_info.json")
@@ -601,15 +1032,41 @@ def main():
         print(f"\n[FILE] 已生成签名说明文件: {signature_info_file}")
         print("   请参考此文件进行手动签名操作")
 
-    input("\n按回车退出...")
+    pause("\n按回车退出...", assume_yes)
     return True
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="PDF重命名工具一键打包+签名程序")
+    parser.add_argument("--yes", "-y", action="store_true",
+                        help="非交互模式：自动确认签名并跳过所有暂停，适用于CI等无人值守环境"
+                             "（也可设置环境变量TEMU_BUILD_YES=1）")
+    parser.add_argument("--skip-sign", "--no-sign", action="store_true",
+                        help="不进行代码签名")
+    parser.add_argument("--skip-portable", action="store_true",
+                        help="不创建便携包")
+    parser.add_argument("--force-clean", action="store_true",
+                        help="删除build缓存目录和spec文件并使用--clean完整重新构建（修改打包参数后需要使用）")
+    parser.add_argument("--onedir", action="store_true",
+                        help="打包为目录版，启动时无需解压到临时目录（自动更新仍使用单文件exe）")
+    parser.add_argument("--no-optimize", action="store_true",
+                        help="不使用--optimize=2打包（保留assert和文档字符串）")
+    args = parser.parse_args()
+    if os.environ.get("TEMU_BUILD_YES") == "1":
+        args.yes = True
+
     try:
-        main()
+        success = main(assume_yes=args.yes, force_clean=args.force_clean, onedir=args.onedir,
+                       optimize=not args.no_optimize, skip_sign=args.skip_sign,
+                       skip_portable=args.skip_portable)
     except KeyboardInterrupt:
         print("\n用户取消操作")
-        input("按回车退出...")
+        pause("按回车退出...", args.yes)
+        success = False
     except Exception as e:
         print(f"\n发生错误: {e}")
-        input("按回车退出...")
\ No newline at end of file
+        pause("按回车退出...", args.yes)
+        success = False
+
+    sys.exit(0 if success else 1)